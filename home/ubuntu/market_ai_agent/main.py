@@ -6,18 +6,14 @@ This module integrates all components and provides the main entry point for the
 
 import os
 import sys
-import json
+import time
 import argparse
 import datetime
 import logging
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-# Import modules
-from modules.news_sentiment import NewsScraperSentiment
-from modules.macro_sentiment import MacroSentimentAnalyzer
-from modules.cme_volume import CMEVolumeTracker
-from modules.sentiment_crosscheck import SentimentCrossChecker
-from modules.report_generator import SummaryReportGenerator
+from modules._json import load_file
 
 # Set up logging
 logging.basicConfig(
@@ -71,9 +67,8 @@ class MarketAIAgent:
         
         # Load custom configuration if provided
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = json.load(f)
-                self._update_config(self.config, custom_config)
+            custom_config = load_file(config_path)
+            self._update_config(self.config, custom_config)
         
         # Create directories
         os.makedirs(self.config["data_dir"], exist_ok=True)
@@ -110,122 +105,144 @@ class MarketAIAgent:
                 base_config[key] = value
     
     def _init_modules(self):
-        """Initialize all modules"""
+        """
+        Initialize all modules
+        
+        Modules are imported only when enabled, so disabled ones don't load
+        their NLP models and plotting dependencies.
+        """
         # News & Sentiment Module
         if self.config["modules"]["news_sentiment"]["enabled"]:
+            from modules.news_sentiment import NewsScraperSentiment
             self.news_sentiment = NewsScraperSentiment()
         else:
             self.news_sentiment = None
         
         # Macro Sentiment Analyzer
         if self.config["modules"]["macro_sentiment"]["enabled"]:
+            from modules.macro_sentiment import MacroSentimentAnalyzer
             self.macro_sentiment = MacroSentimentAnalyzer()
         else:
             self.macro_sentiment = None
         
         # CME Volume/Open Interest Tracker
         if self.config["modules"]["cme_volume"]["enabled"]:
+            from modules.cme_volume import CMEVolumeTracker
             self.cme_volume = CMEVolumeTracker()
         else:
             self.cme_volume = None
         
         # Sentiment Cross-check Module
         if self.config["modules"]["sentiment_crosscheck"]["enabled"]:
+            from modules.sentiment_crosscheck import SentimentCrossChecker
             self.sentiment_crosscheck = SentimentCrossChecker()
         else:
             self.sentiment_crosscheck = None
         
         # Summary Report Generator
         if self.config["modules"]["report_generator"]["enabled"]:
+            from modules.report_generator import SummaryReportGenerator
             self.report_generator = SummaryReportGenerator()
         else:
             self.report_generator = None
     
-    def run_news_sentiment(self):
-        """Run News & Sentiment Module"""
-        if not self.news_sentiment:
-            logger.warning("News & Sentiment Module is disabled")
+    def _run_module(self, name, label, task, *args, **kwargs):
+        """
+        Run a module task with the shared enable check, logging and error handling
+        
+        Set the PYTHON_PERF=1 environment variable to log how long each module takes.
+        
+        Args:
+            name (str): Module attribute name (e.g., "news_sentiment")
+            label (str): Human-readable module name for log messages
+            task (callable): Function performing the module's steps
+            
+        Returns:
+            Result of the task, or None if the module is disabled or fails
+        """
+        if not getattr(self, name):
+            logger.warning(f"{label} is disabled")
             return None
         
-        logger.info("Running News & Sentiment Module...")
+        logger.info(f"Running {label}...")
         
+        start = time.perf_counter_ns()
         try:
-            # Scrape news
-            max_articles = self.config["modules"]["news_sentiment"]["max_articles_per_source"]
-            articles = self.news_sentiment.scrape_news(max_articles_per_source=max_articles)
-            logger.info(f"Scraped {len(articles)} articles")
-            
-            # Analyze sentiment
-            analyzed = self.news_sentiment.analyze_sentiment()
-            logger.info(f"Analyzed {len(analyzed)} articles")
-            
-            # Generate position suggestions
-            suggestions = self.news_sentiment.generate_position_suggestions()
-            logger.info(f"Generated {len(suggestions['bullish'])} bullish, {len(suggestions['bearish'])} bearish suggestions")
-            
-            # Save results
-            self.news_sentiment.save_results(self.data_paths["news_sentiment"])
-            logger.info(f"Saved news sentiment results to {self.data_paths['news_sentiment']}")
-            
-            return suggestions
+            return task(*args, **kwargs)
             
         except Exception as e:
-            logger.error(f"Error in News & Sentiment Module: {str(e)}")
+            logger.error(f"Error in {label}: {str(e)}")
             return None
+            
+        finally:
+            if os.environ.get("PYTHON_PERF") == "1":
+                logger.info(f"{label} took {(time.perf_counter_ns() - start) / 1e6:.1f} ms")
+    
+    def run_news_sentiment(self):
+        """Run News & Sentiment Module"""
+        return self._run_module("news_sentiment", "News & Sentiment Module", self._news_sentiment_task)
+    
+    def _news_sentiment_task(self):
+        """Steps of the News & Sentiment Module run"""
+        # Scrape news
+        max_articles = self.config["modules"]["news_sentiment"]["max_articles_per_source"]
+        articles = self.news_sentiment.scrape_news(max_articles_per_source=max_articles)
+        logger.info(f"Scraped {len(articles)} articles")
+        
+        # Analyze sentiment
+        analyzed = self.news_sentiment.analyze_sentiment()
+        logger.info(f"Analyzed {len(analyzed)} articles")
+        
+        # Generate position suggestions
+        suggestions = self.news_sentiment.generate_position_suggestions()
+        logger.info(f"Generated {len(suggestions['bullish'])} bullish, {len(suggestions['bearish'])} bearish suggestions")
+        
+        # Save results
+        self.news_sentiment.save_results(self.data_paths["news_sentiment"])
+        logger.info(f"Saved news sentiment results to {self.data_paths['news_sentiment']}")
+        
+        return suggestions
     
     def run_macro_sentiment(self):
         """Run Macro Sentiment Analyzer"""
-        if not self.macro_sentiment:
-            logger.warning("Macro Sentiment Analyzer is disabled")
-            return None
+        return self._run_module("macro_sentiment", "Macro Sentiment Analyzer", self._macro_sentiment_task)
+    
+    def _macro_sentiment_task(self):
+        """Steps of the Macro Sentiment Analyzer run"""
+        # Run analysis
+        use_mock_data = self.config["use_mock_data"]
+        with self.macro_sentiment.refresh_cycle():
+            analysis = self.macro_sentiment.run_analysis(use_mock_data=use_mock_data)
         
-        logger.info("Running Macro Sentiment Analyzer...")
+        # Log ES bias
+        if self.macro_sentiment.es_bias:
+            logger.info(f"ES Bias: {self.macro_sentiment.es_bias['direction']} ({self.macro_sentiment.es_bias['confidence']} confidence)")
         
-        try:
-            # Run analysis
-            use_mock_data = self.config["use_mock_data"]
-            analysis = self.macro_sentiment.run_analysis(use_mock_data=use_mock_data)
-            
-            # Log ES bias
-            if self.macro_sentiment.es_bias:
-                logger.info(f"ES Bias: {self.macro_sentiment.es_bias['direction']} ({self.macro_sentiment.es_bias['confidence']} confidence)")
-            
-            # Save results
-            self.macro_sentiment.save_results(self.data_paths["macro_sentiment"])
-            logger.info(f"Saved macro sentiment results to {self.data_paths['macro_sentiment']}")
-            
-            return analysis
-            
-        except Exception as e:
-            logger.error(f"Error in Macro Sentiment Analyzer: {str(e)}")
-            return None
+        # Save results
+        self.macro_sentiment.save_results(self.data_paths["macro_sentiment"])
+        logger.info(f"Saved macro sentiment results to {self.data_paths['macro_sentiment']}")
+        
+        return analysis
     
     def run_cme_volume(self):
         """Run CME Volume/Open Interest Tracker"""
-        if not self.cme_volume:
-            logger.warning("CME Volume/Open Interest Tracker is disabled")
-            return None
+        return self._run_module("cme_volume", "CME Volume/Open Interest Tracker", self._cme_volume_task)
+    
+    def _cme_volume_task(self):
+        """Steps of the CME Volume/Open Interest Tracker run"""
+        # Run analysis
+        use_mock_data = self.config["use_mock_data"]
+        contracts = self.config["modules"]["cme_volume"]["contracts"]
+        results = self.cme_volume.run_analysis(contracts=contracts, use_mock_data=use_mock_data)
         
-        logger.info("Running CME Volume/Open Interest Tracker...")
+        # Log alerts
+        logger.info(f"Generated {len(self.cme_volume.alerts)} alerts")
         
-        try:
-            # Run analysis
-            use_mock_data = self.config["use_mock_data"]
-            contracts = self.config["modules"]["cme_volume"]["contracts"]
-            results = self.cme_volume.run_analysis(contracts=contracts, use_mock_data=use_mock_data)
-            
-            # Log alerts
-            logger.info(f"Generated {len(self.cme_volume.alerts)} alerts")
-            
-            # Save results
-            self.cme_volume.save_results(self.data_paths["cme_volume"])
-            logger.info(f"Saved CME volume results to {self.data_paths['cme_volume']}")
-            
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error in CME Volume/Open Interest Tracker: {str(e)}")
-            return None
+        # Save results
+        self.cme_volume.save_results(self.data_paths["cme_volume"])
+        logger.info(f"Saved CME volume results to {self.data_paths['cme_volume']}")
+        
+        return results
     
     def run_sentiment_crosscheck(self, news_sentiment=None):
         """
@@ -234,68 +251,58 @@ class MarketAIAgent:
         Args:
             news_sentiment (dict): News sentiment data from News & Sentiment Module
         """
-        if not self.sentiment_crosscheck:
-            logger.warning("Sentiment Cross-check Module is disabled")
-            return None
+        return self._run_module("sentiment_crosscheck", "Sentiment Cross-check Module",
+                                self._sentiment_crosscheck_task, news_sentiment=news_sentiment)
+    
+    def _sentiment_crosscheck_task(self, news_sentiment=None):
+        """Steps of the Sentiment Cross-check Module run"""
+        # Run analysis
+        use_mock_data = self.config["use_mock_data"]
+        results = self.sentiment_crosscheck.run_analysis(news_sentiment=news_sentiment, use_mock_data=use_mock_data)
         
-        logger.info("Running Sentiment Cross-check Module...")
+        # Log divergences
+        if self.sentiment_crosscheck.divergences:
+            logger.info(f"Found {len(self.sentiment_crosscheck.divergences)} sentiment divergences")
+        else:
+            logger.info("No sentiment divergences found")
         
-        try:
-            # Run analysis
-            use_mock_data = self.config["use_mock_data"]
-            results = self.sentiment_crosscheck.run_analysis(news_sentiment=news_sentiment, use_mock_data=use_mock_data)
-            
-            # Log divergences
-            if self.sentiment_crosscheck.divergences:
-                logger.info(f"Found {len(self.sentiment_crosscheck.divergences)} sentiment divergences")
-            else:
-                logger.info("No sentiment divergences found")
-            
-            # Save results
-            self.sentiment_crosscheck.save_results(self.data_paths["sentiment_crosscheck"])
-            logger.info(f"Saved sentiment cross-check results to {self.data_paths['sentiment_crosscheck']}")
-            
-            return results
-            
-        except Exception as e:
-            logger.error(f"Error in Sentiment Cross-check Module: {str(e)}")
-            return None
+        # Save results
+        self.sentiment_crosscheck.save_results(self.data_paths["sentiment_crosscheck"])
+        logger.info(f"Saved sentiment cross-check results to {self.data_paths['sentiment_crosscheck']}")
+        
+        return results
     
     def run_report_generator(self):
         """Run Summary Report Generator"""
-        if not self.report_generator:
-            logger.warning("Summary Report Generator is disabled")
-            return None
+        return self._run_module("report_generator", "Summary Report Generator", self._report_generator_task)
+    
+    def _report_generator_task(self):
+        """Steps of the Summary Report Generator run"""
+        # Run report generation
+        saved_files = self.report_generator.run(
+            data_dir=self.config["data_dir"],
+            output_dir=self.config["reports_dir"]
+        )
         
-        logger.info("Running Summary Report Generator...")
+        logger.info(f"Report saved to: {saved_files}")
         
-        try:
-            # Run report generation
-            saved_files = self.report_generator.run(
-                data_dir=self.config["data_dir"],
-                output_dir=self.config["reports_dir"]
-            )
-            
-            logger.info(f"Report saved to: {saved_files}")
-            
-            return saved_files
-            
-        except Exception as e:
-            logger.error(f"Error in Summary Report Generator: {str(e)}")
-            return None
+        return saved_files
     
     def run_all(self):
-        """Run all modules in sequence"""
+        """Run all modules, overlapping the independent ones"""
         logger.info("Starting Market AI Agent run...")
         
-        # Run News & Sentiment Module
-        news_results = self.run_news_sentiment()
-        
-        # Run Macro Sentiment Analyzer
-        macro_results = self.run_macro_sentiment()
-        
-        # Run CME Volume/Open Interest Tracker
-        cme_results = self.run_cme_volume()
+        # Run the independent modules concurrently (News & Sentiment, Macro
+        # Sentiment Analyzer, CME Volume/Open Interest Tracker). Each saves to
+        # its own data directory, so they share no state.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            news_future = executor.submit(self.run_news_sentiment)
+            macro_future = executor.submit(self.run_macro_sentiment)
+            cme_future = executor.submit(self.run_cme_volume)
+            
+            news_results = news_future.result()
+            macro_results = macro_future.result()
+            cme_results = cme_future.result()
         
         # Run Sentiment Cross-check Module
         sentiment_results = self.run_sentiment_crosscheck(news_sentiment=news_results)
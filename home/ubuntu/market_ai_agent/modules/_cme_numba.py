@@ -0,0 +1,72 @@
+"""
+Numeric kernels for the CME Volume/Open Interest Tracker
+
+These functions operate on raw NumPy arrays and are compiled with Numba when it
+is installed. Without Numba they run as plain NumPy/Python functions.
+"""
+
+import numpy as np
+
+from modules._numba import njit
+
+
+@njit(cache=True)
+def rolling_mean(values, window):
+    """
+    Trailing rolling mean with a minimum of one observation
+
+    Matches pandas ``Series.rolling(window, min_periods=1).mean()``.
+
+    Args:
+        values (np.ndarray): Input values (float64)
+        window (int): Rolling window length
+
+    Returns:
+        np.ndarray: Rolling mean for each position
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+    for i in range(n):
+        total += values[i]
+        if i >= window:
+            total -= values[i - window]
+        out[i] = total / min(i + 1, window)
+    return out
+
+
+@njit(cache=True)
+def spike_indices(values, avg, threshold):
+    """
+    Find positions where values exceed their average by a ratio threshold
+
+    Args:
+        values (np.ndarray): Observed values
+        avg (np.ndarray): Average values
+        threshold (float): Minimum ratio of value to average
+
+    Returns:
+        tuple: (indices, ratio) arrays
+    """
+    ratio = values / avg
+    return np.nonzero(ratio > threshold)[0], ratio
+
+
+@njit(cache=True)
+def pct_change_indices(change, open_interest, threshold):
+    """
+    Find positions where the change relative to the prior level exceeds a threshold
+
+    The first position has no prior level and is never flagged.
+
+    Args:
+        change (np.ndarray): Day-over-day change
+        open_interest (np.ndarray): Open interest levels
+        threshold (float): Minimum absolute percentage change
+
+    Returns:
+        tuple: (indices, pct_change) arrays
+    """
+    pct_change = np.full(change.shape[0], np.nan)
+    pct_change[1:] = change[1:] / open_interest[:-1]
+    return np.nonzero(np.abs(pct_change) > threshold)[0], pct_change
@@ -0,0 +1,84 @@
+"""
+JSON helpers for Market AI Agent
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Both paths serialize datetimes as ISO 8601 strings and NumPy
+scalars/arrays as plain JSON numbers and lists.
+"""
+
+import os
+import json
+import mmap
+import datetime
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """Serialize objects the JSON encoders don't handle natively"""
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def loads(data):
+    """
+    Deserialize JSON from bytes or str
+
+    Args:
+        data (bytes | str): JSON document
+
+    Returns:
+        object: Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=False):
+    """
+    Serialize an object to JSON bytes
+
+    Args:
+        obj (object): Object to serialize
+        indent (bool): Whether to pretty-print with two-space indentation
+
+    Returns:
+        bytes: Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode("utf-8")
+
+
+def load_file(path):
+    """
+    Load JSON from a file
+
+    With orjson the file is memory-mapped and parsed in place.
+
+    Args:
+        path (str): Path to JSON file
+
+    Returns:
+        object: Decoded JSON value
+    """
+    with open(path, 'rb') as f:
+        # orjson parses straight from a memory map, skipping the copy of the file into a bytes object
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return loads(f.read())
@@ -0,0 +1,19 @@
+"""
+Deferred imports for Market AI Agent
+
+Heavy dependencies are bound to module-level stand-ins that import the real
+module on first attribute access, so importing a module that names them stays
+cheap until a code path actually uses them.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
@@ -0,0 +1,63 @@
+"""
+Shared sentiment models for Market AI Agent
+
+The VADER analyzer and the quantized ONNX classification pipeline are loaded
+here once per process, so the news and social sentiment modules share them
+instead of each loading their own copy.
+"""
+
+import os
+from functools import lru_cache
+from importlib.util import find_spec
+
+from modules._lazy import LazyModule
+
+transformers = LazyModule("transformers")
+vader_sentiment = LazyModule("vaderSentiment.vaderSentiment")
+
+# True when optimum and ONNX Runtime are installed
+ONNX_AVAILABLE = bool(find_spec("optimum") and find_spec("onnxruntime"))
+
+if ONNX_AVAILABLE:
+    onnxruntime = LazyModule("onnxruntime")
+    optimum_ort = LazyModule("optimum.onnxruntime")
+    optimum_ort_config = LazyModule("optimum.onnxruntime.configuration")
+    optimum_pipelines = LazyModule("optimum.pipelines")
+
+
+@lru_cache(maxsize=None)
+def shared_vader():
+    """Get the process-wide VADER analyzer, loading its lexicon on first use"""
+    return vader_sentiment.SentimentIntensityAnalyzer()
+
+
+def load_onnx_pipeline(model, onnx_dir, num_threads):
+    """
+    Load the quantized ONNX classification pipeline, exporting the model if needed
+
+    Args:
+        model (str): Hugging Face model name
+        onnx_dir (str): Directory of the quantized ONNX export
+        num_threads (int): ONNX Runtime intra-op threads
+
+    Returns:
+        callable: ONNX Runtime text classification pipeline
+    """
+    os.environ.setdefault("OMP_NUM_THREADS", str(num_threads))
+
+    if not os.path.exists(os.path.join(onnx_dir, "model_quantized.onnx")):
+        # Export to ONNX and apply dynamic INT8 quantization
+        ort_model = optimum_ort.ORTModelForSequenceClassification.from_pretrained(model, export=True)
+        quantizer = optimum_ort.ORTQuantizer.from_pretrained(ort_model)
+        qconfig = optimum_ort_config.AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=onnx_dir, quantization_config=qconfig)
+        transformers.AutoTokenizer.from_pretrained(model).save_pretrained(onnx_dir)
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = num_threads
+
+    ort_model = optimum_ort.ORTModelForSequenceClassification.from_pretrained(
+        onnx_dir, file_name="model_quantized.onnx", session_options=session_options)
+    tokenizer = transformers.AutoTokenizer.from_pretrained(onnx_dir, use_fast=True)
+
+    return optimum_pipelines.pipeline("text-classification", model=ort_model, tokenizer=tokenizer, accelerator="ort")
@@ -0,0 +1,19 @@
+"""
+Optional Numba support for Market AI Agent
+
+Exports numba.njit when Numba is installed, and otherwise a no-op decorator
+so the numeric kernels run as plain NumPy/Python functions.
+"""
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -0,0 +1,40 @@
+"""
+Numeric kernels for the Sentiment Cross-check Module
+
+These functions operate on raw NumPy arrays and are compiled with Numba when it
+is installed. Without Numba they run as plain NumPy/Python functions.
+"""
+
+import numpy as np
+
+from modules._numba import njit
+
+
+@njit(cache=True)
+def assign_sentiment_codes(rand, bullish_ratio, bearish_ratio):
+    """
+    Map uniform draws to sentiment codes
+
+    Draws below bullish_ratio are bullish (0), those below bullish_ratio +
+    bearish_ratio bearish (1) and the rest neutral (2).
+
+    Args:
+        rand (np.ndarray): Uniform draws in [0, 1)
+        bullish_ratio (float): Share of bullish posts
+        bearish_ratio (float): Share of bearish posts
+
+    Returns:
+        np.ndarray: Sentiment code for each draw (int64)
+    """
+    n = rand.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    bearish_cutoff = bullish_ratio + bearish_ratio
+    for i in range(n):
+        r = rand[i]
+        if r < bullish_ratio:
+            out[i] = 0
+        elif r < bearish_cutoff:
+            out[i] = 1
+        else:
+            out[i] = 2
+    return out
@@ -0,0 +1,142 @@
+"""
+File-based TTL cache for Market AI Agent
+
+Stores JSON-serializable results of slow lookups (web pages, API calls) on disk
+so repeated runs within an indicator's refresh interval skip the network.
+"""
+
+import os
+import json
+import time
+import hashlib
+import inspect
+import functools
+
+from modules._json import dumps, load_file
+
+MISS = object()
+
+
+class FileCache:
+    def __init__(self, cache_dir):
+        """
+        Initialize the file cache
+
+        Args:
+            cache_dir (str): Directory for cache files
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, endpoint, params):
+        """Get the cache file path for an endpoint and its parameters"""
+        digest = hashlib.md5(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{endpoint}_{digest}.json")
+
+    def get(self, endpoint, params, ttl):
+        """
+        Get a cached value if it is still fresh
+
+        Args:
+            endpoint (str): Name of the cached lookup
+            params (dict): Parameters identifying the lookup
+            ttl (float): Maximum age in seconds
+
+        Returns:
+            object: Cached value, or MISS if absent or expired
+        """
+        path = self._path(endpoint, params)
+        if not os.path.exists(path):
+            return MISS
+
+        try:
+            entry = load_file(path)
+        except (OSError, ValueError):
+            return MISS
+
+        if time.time() - entry["ts"] >= ttl:
+            return MISS
+
+        return entry["value"]
+
+    def set(self, endpoint, params, value, ttl):
+        """
+        Store a value in the cache
+
+        Args:
+            endpoint (str): Name of the cached lookup
+            params (dict): Parameters identifying the lookup
+            value (object): JSON-serializable value
+            ttl (float): Time to live in seconds (stored for reference)
+        """
+        path = self._path(endpoint, params)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(dumps({"value": value, "ts": time.time(), "ttl": ttl}))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as e:
+            print(f"Error writing cache entry {path}: {str(e)}")
+
+
+def cached(endpoint, ttl_key, ignore=()):
+    """
+    Cache a method's result in the instance's FileCache
+
+    The instance must provide ``self._cache`` (a FileCache) and a TTL in seconds
+    at ``self.config["cache_ttls"][ttl_key]``. The wrapped method accepts an
+    extra ``force_refresh`` keyword argument that bypasses the cached value.
+    None results are not cached. Works for both regular and async methods.
+
+    Args:
+        endpoint (str): Name of the cached lookup, used in the cache file name
+        ttl_key (str): Key of the TTL in the instance's cache_ttls configuration
+        ignore (tuple): Parameter names left out of the cache key (e.g., sessions)
+
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def cache_params(self, args, kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return {name: value for name, value in list(bound.arguments.items())[1:] if name not in ignore}
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, force_refresh=False, **kwargs):
+                params = cache_params(self, args, kwargs)
+                ttl = self.config["cache_ttls"][ttl_key]
+                if not force_refresh:
+                    value = self._cache.get(endpoint, params, ttl)
+                    if value is not MISS:
+                        return value
+
+                value = await func(self, *args, **kwargs)
+                if value is not None:
+                    self._cache.set(endpoint, params, value, ttl)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, force_refresh=False, **kwargs):
+            params = cache_params(self, args, kwargs)
+            ttl = self.config["cache_ttls"][ttl_key]
+            if not force_refresh:
+                value = self._cache.get(endpoint, params, ttl)
+                if value is not MISS:
+                    return value
+
+            value = func(self, *args, **kwargs)
+            if value is not None:
+                self._cache.set(endpoint, params, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
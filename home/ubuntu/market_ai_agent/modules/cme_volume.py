@@ -8,14 +8,15 @@ This module is responsible for:
 """
 
 import os
-import json
 import datetime
+import threading
 import pandas as pd
 import numpy as np
-import requests
-from bs4 import BeautifulSoup
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from modules._json import load_file
+from modules._cme_numba import rolling_mean, spike_indices, pct_change_indices
 
 class CMEVolumeTracker:
     def __init__(self, config_path=None):
@@ -49,6 +50,10 @@ class CMEVolumeTracker:
                 "oi_change": 0.1,     # 10% change in open interest
                 "alert_period": 7     # Days to look back for alerts
             },
+            "cache": {
+                "enabled": True,  # Reuse fetched data across runs on the same day
+                "dir": os.path.join("data", "cme_volume", "cache")
+            },
             "economic_calendar": {
                 "fomc_meetings": [
                     "2025-04-30",
@@ -75,22 +80,54 @@ class CMEVolumeTracker:
         
         # Load custom configuration if provided
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = json.load(f)
-                self.config.update(custom_config)
+            custom_config = load_file(config_path)
+            self.config.update(custom_config)
+        
+        # Parse the economic calendar once so lookups don't re-run strptime per event
+        self._parse_economic_calendar()
         
         # Initialize data storage
         self.volume_data = {}
         self.oi_data = {}
         self.alerts = []
+        self._stats_cache = {}
+        self._data_lock = threading.Lock()
+    
+    def _parse_economic_calendar(self):
+        """Parse economic calendar date strings into datetime objects"""
+        calendar = self.config["economic_calendar"]
+        
+        # Keep entries in date order so nearby events are reported chronologically
+        by_date = lambda entry: entry[0]
+        self._fomc_dt = sorted(
+            ((datetime.strptime(d, "%Y-%m-%d"), d) for d in calendar["fomc_meetings"]), key=by_date
+        )
+        self._earnings_dt = sorted(
+            ((datetime.strptime(s["start"], "%Y-%m-%d"), datetime.strptime(s["end"], "%Y-%m-%d"), s)
+             for s in calendar["earnings_seasons"]),
+            key=by_date
+        )
+        self._releases_dt = sorted(
+            ((datetime.strptime(r["date"], "%Y-%m-%d"), r) for r in calendar["economic_releases"]), key=by_date
+        )
+        
+        # Array views for vectorized date arithmetic. Calendar dates fall on midnight,
+        # so whole-day differences against a date's calendar day match timedelta.days.
+        self._fomc_dt64 = np.array([dt for dt, _ in self._fomc_dt], dtype="datetime64[ns]")
+        self._fomc_days = self._fomc_dt64.astype("datetime64[D]")
+        self._earnings_start_dt64 = np.array([start for start, _, _ in self._earnings_dt], dtype="datetime64[ns]")
+        self._earnings_end_dt64 = np.array([end for _, end, _ in self._earnings_dt], dtype="datetime64[ns]")
+        self._earnings_start_days = self._earnings_start_dt64.astype("datetime64[D]")
+        self._releases_days = np.array([dt for dt, _ in self._releases_dt], dtype="datetime64[D]")
     
-    def fetch_cme_data(self, contract="ES", use_mock_data=True):
+    def fetch_cme_data(self, contract="ES", use_mock_data=True, now=None):
         """
         Fetch volume and open interest data for a specific contract
         
         Args:
             contract (str): Contract symbol (e.g., "ES" for S&P 500 E-mini)
             use_mock_data (bool): Whether to use mock data instead of actual scraping
+            now (datetime): End of the data window (default: current time)
             
         Returns:
             tuple: (volume_df, oi_df) DataFrames containing volume and open interest data
@@ -100,63 +137,25 @@ class CMEVolumeTracker:
             return None, None
         
         if use_mock_data:
-            # Generate mock data for demonstration
-            # In a real implementation, you would scrape the CME website
-            
-            # Create date range for the past 30 days
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=30)
-            date_range = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days
+            if now is None:
+                now = datetime.now()
             
-            # Generate mock volume data
-            base_volume = 2000000 if contract == "ES" else (1500000 if contract == "NQ" else 1000000)
-            volume_data = []
-            
-            for date in date_range:
-                # Add some randomness and a slight upward trend
-                daily_volume = int(base_volume * (1 + 0.3 * np.random.randn() + 0.01 * (date - start_date).days))
-                
-                # Add a volume spike for FOMC meetings
-                fomc_dates = [datetime.strptime(d, "%Y-%m-%d") for d in self.config["economic_calendar"]["fomc_meetings"]]
-                for fomc_date in fomc_dates:
-                    if abs((date - fomc_date).days) <= 1:  # Day before or day of FOMC
-                        daily_volume = int(daily_volume * 1.8)  # 80% spike
-                
-                volume_data.append({
-                    'date': date,
-                    'contract': contract,
-                    'volume': daily_volume,
-                    'electronic_volume': int(daily_volume * 0.95),  # 95% electronic
-                    'open_outcry_volume': int(daily_volume * 0.05)  # 5% open outcry
-                })
-            
-            volume_df = pd.DataFrame(volume_data)
-            
-            # Generate mock open interest data
-            base_oi = 3000000 if contract == "ES" else (2000000 if contract == "NQ" else 1500000)
-            oi_data = []
-            
-            current_oi = base_oi
-            for date in date_range:
-                # Add some randomness and a slight trend
-                daily_change = int(base_oi * 0.02 * np.random.randn())  # 2% random change
-                current_oi += daily_change
-                
-                # Ensure OI doesn't go below a minimum threshold
-                current_oi = max(current_oi, base_oi * 0.8)
-                
-                oi_data.append({
-                    'date': date,
-                    'contract': contract,
-                    'open_interest': current_oi,
-                    'change': daily_change
-                })
-            
-            oi_df = pd.DataFrame(oi_data)
+            # Reuse data already fetched today, if cached
+            cached = self._load_cached_data(contract, now)
+            if cached is not None:
+                volume_df, oi_df = cached
+            else:
+                volume_df, oi_df = self._generate_mock_data(contract, now)
+                self._save_cached_data(contract, now, volume_df, oi_df)
             
             # Store the data
-            self.volume_data[contract] = volume_df
-            self.oi_data[contract] = oi_df
+            with self._data_lock:
+                self.volume_data[contract] = volume_df
+                self.oi_data[contract] = oi_df
+                
+                # Drop derived stats for the previous data
+                for key in [k for k in self._stats_cache if k[1] == contract]:
+                    del self._stats_cache[key]
             
             return volume_df, oi_df
         else:
@@ -164,7 +163,131 @@ class CMEVolumeTracker:
             # This would require more complex implementation with proper HTML parsing
             # For now, we'll leave this as a placeholder
             print("Real data scraping not implemented, using mock data instead")
-            return self.fetch_cme_data(contract, use_mock_data=True)
+            return self.fetch_cme_data(contract, use_mock_data=True, now=now)
+    
+    def _cache_paths(self, contract, now):
+        """
+        Get the parquet cache file paths for a contract's data on a given day
+        
+        Args:
+            contract (str): Contract symbol
+            now (datetime): Day the data was fetched
+            
+        Returns:
+            tuple: (volume_path, oi_path)
+        """
+        prefix = os.path.join(self.config["cache"]["dir"], f"{contract}_{now:%Y%m%d}")
+        return f"{prefix}_volume.parquet", f"{prefix}_oi.parquet"
+    
+    def _load_cached_data(self, contract, now):
+        """
+        Load a contract's data for the day from the parquet cache
+        
+        Args:
+            contract (str): Contract symbol
+            now (datetime): Day the data was fetched
+            
+        Returns:
+            tuple: (volume_df, oi_df), or None if not cached
+        """
+        if not self.config["cache"]["enabled"]:
+            return None
+        
+        volume_path, oi_path = self._cache_paths(contract, now)
+        if not (os.path.exists(volume_path) and os.path.exists(oi_path)):
+            return None
+        
+        try:
+            return pd.read_parquet(volume_path), pd.read_parquet(oi_path)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"Error reading cached data for {contract}: {str(e)}")
+            return None
+    
+    def _save_cached_data(self, contract, now, volume_df, oi_df):
+        """
+        Save a contract's data for the day to the parquet cache
+        
+        Args:
+            contract (str): Contract symbol
+            now (datetime): Day the data was fetched
+            volume_df (pd.DataFrame): Volume data
+            oi_df (pd.DataFrame): Open interest data
+        """
+        if not self.config["cache"]["enabled"]:
+            return
+        
+        try:
+            os.makedirs(self.config["cache"]["dir"], exist_ok=True)
+            for df, path in zip((volume_df, oi_df), self._cache_paths(contract, now)):
+                # Write to a temporary file first so readers never see a partial file
+                tmp_path = f"{path}.tmp"
+                df.to_parquet(tmp_path, compression="zstd", index=False)
+                os.replace(tmp_path, path)
+        except (ImportError, OSError, ValueError) as e:
+            # Parquet support (pyarrow) is optional; run without the cache if it's missing
+            print(f"Error caching data for {contract}: {str(e)}")
+    
+    def _generate_mock_data(self, contract, now):
+        """
+        Generate mock volume and open interest data for a contract
+        
+        Args:
+            contract (str): Contract symbol
+            now (datetime): End of the data window
+            
+        Returns:
+            tuple: (volume_df, oi_df) DataFrames containing volume and open interest data
+        """
+        # Generate mock data for demonstration
+        # In a real implementation, you would scrape the CME website
+        
+        # Create date range for the past 30 days
+        end_date = now
+        start_date = end_date - timedelta(days=30)
+        date_range = pd.date_range(start=start_date, end=end_date, freq='B')  # Business days
+        
+        n_days = len(date_range)
+        rng = np.random.default_rng()
+        
+        # Generate mock volume data with some randomness and a slight upward trend
+        base_volume = 2000000 if contract == "ES" else (1500000 if contract == "NQ" else 1000000)
+        day_offset = (date_range - start_date).days.to_numpy()
+        noise = rng.standard_normal(n_days)
+        daily_volume = (base_volume * (1 + 0.3 * noise + 0.01 * day_offset)).astype(np.int64)
+        
+        # Add a volume spike for FOMC meetings (day before or day of FOMC)
+        if len(self._fomc_dt64):
+            days_diff = (date_range.values[:, None] - self._fomc_dt64[None, :]) // np.timedelta64(1, 'D')
+            fomc_mask = (np.abs(days_diff) <= 1).any(axis=1)
+            daily_volume[fomc_mask] = (daily_volume[fomc_mask] * 1.8).astype(np.int64)  # 80% spike
+        
+        volume_df = pd.DataFrame({
+            'date': date_range,
+            'contract': contract,
+            'volume': daily_volume,
+            'electronic_volume': (daily_volume * 0.95).astype(np.int64),  # 95% electronic
+            'open_outcry_volume': (daily_volume * 0.05).astype(np.int64)  # 5% open outcry
+        }, copy=False)
+        
+        # Generate mock open interest data
+        base_oi = 3000000 if contract == "ES" else (2000000 if contract == "NQ" else 1500000)
+        daily_change = (base_oi * 0.02 * rng.standard_normal(n_days)).astype(np.int64)  # 2% random change
+        
+        # Ensure OI doesn't go below a minimum threshold. Clamping at every step is a
+        # Lindley recursion, so the running position above the floor is the cumulative
+        # sum minus its running minimum (whenever that minimum dips below zero).
+        min_oi = base_oi * 0.8
+        above_floor = (base_oi - min_oi) + np.cumsum(daily_change)
+        open_interest = min_oi + above_floor - np.minimum(np.minimum.accumulate(above_floor), 0)
+        
+        oi_df = pd.DataFrame({
+            'date': date_range,
+            'contract': contract,
+            'open_interest': open_interest,
+            'change': daily_change
+        }, copy=False)
+        
+        return volume_df, oi_df
     
     def detect_volume_spikes(self, contract="ES", lookback_period=10):
         """
@@ -177,39 +300,45 @@ class CMEVolumeTracker:
         Returns:
             list: List of volume spike events
         """
-        if contract not in self.volume_data:
-            print(f"No volume data for contract {contract}")
+        spike_df = self._detect_volume_spikes_frame(contract, lookback_period)
+        if spike_df is None:
             return []
         
-        volume_df = self.volume_data[contract].copy()
-        
-        # Sort by date
-        volume_df = volume_df.sort_values('date')
+        return spike_df.to_dict(orient='records')
+    
+    def _detect_volume_spikes_frame(self, contract, lookback_period=10):
+        """
+        Detect volume spikes for a specific contract as a DataFrame
         
-        # Calculate rolling average volume
-        volume_df['avg_volume'] = volume_df['volume'].rolling(window=lookback_period, min_periods=1).mean()
+        Args:
+            contract (str): Contract symbol
+            lookback_period (int): Number of days to look back for calculating average
+            
+        Returns:
+            pd.DataFrame: One row per volume spike event, or None without data
+        """
+        if contract not in self.volume_data:
+            print(f"No volume data for contract {contract}")
+            return None
         
-        # Calculate volume ratio
-        volume_df['volume_ratio'] = volume_df['volume'] / volume_df['avg_volume']
+        # Sorted data and rolling average volume (cached until the contract is re-fetched)
+        volume_df, volume, avg_volume = self._get_volume_stats(contract, lookback_period)
         
         # Detect spikes
         threshold = self.config["thresholds"]["volume_spike"]
-        spike_df = volume_df[volume_df['volume_ratio'] > threshold].copy()
+        spike_idx, volume_ratio = spike_indices(volume, avg_volume, threshold)
         
         # Format spike events
-        spike_events = []
-        for _, row in spike_df.iterrows():
-            event = {
-                'date': row['date'],
-                'contract': contract,
-                'volume': row['volume'],
-                'avg_volume': row['avg_volume'],
-                'ratio': row['volume_ratio'],
-                'type': 'volume_spike'
-            }
-            spike_events.append(event)
-        
-        return spike_events
+        spike_df = pd.DataFrame({
+            'date': volume_df['date'].to_numpy()[spike_idx],
+            'contract': contract,
+            'volume': volume_df['volume'].to_numpy()[spike_idx],
+            'avg_volume': avg_volume[spike_idx],
+            'ratio': volume_ratio[spike_idx],
+            'type': 'volume_spike'
+        })
+        
+        return spike_df
     
     def detect_oi_changes(self, contract="ES", threshold=None):
         """
@@ -222,40 +351,111 @@ class CMEVolumeTracker:
         Returns:
             list: List of OI change events
         """
-        if contract not in self.oi_data:
-            print(f"No open interest data for contract {contract}")
+        change_df = self._detect_oi_changes_frame(contract, threshold)
+        if change_df is None:
             return []
         
-        oi_df = self.oi_data[contract].copy()
+        return change_df.to_dict(orient='records')
+    
+    def _detect_oi_changes_frame(self, contract, threshold=None):
+        """
+        Detect significant open interest changes for a specific contract as a DataFrame
         
-        # Sort by date
-        oi_df = oi_df.sort_values('date')
+        Args:
+            contract (str): Contract symbol
+            threshold (float): Threshold for significant change (default: from config)
+            
+        Returns:
+            pd.DataFrame: One row per OI change event, or None without data
+        """
+        if contract not in self.oi_data:
+            print(f"No open interest data for contract {contract}")
+            return None
         
-        # Calculate percentage change
-        oi_df['pct_change'] = oi_df['change'] / oi_df['open_interest'].shift(1)
+        # Sorted data (cached until the contract is re-fetched)
+        oi_df, change, open_interest = self._get_oi_stats(contract)
         
         # Use default threshold if not provided
         if threshold is None:
             threshold = self.config["thresholds"]["oi_change"]
         
-        # Detect significant changes
-        change_df = oi_df[abs(oi_df['pct_change']) > threshold].copy()
+        # Calculate percentage change and detect significant changes
+        change_idx, pct_change = pct_change_indices(change, open_interest, threshold)
         
         # Format change events
-        change_events = []
-        for _, row in change_df.iterrows():
-            event = {
-                'date': row['date'],
-                'contract': contract,
-                'open_interest': row['open_interest'],
-                'change': row['change'],
-                'pct_change': row['pct_change'],
-                'type': 'oi_change',
-                'direction': 'increase' if row['change'] > 0 else 'decrease'
-            }
-            change_events.append(event)
+        changes = oi_df['change'].to_numpy()[change_idx]
+        change_df = pd.DataFrame({
+            'date': oi_df['date'].to_numpy()[change_idx],
+            'contract': contract,
+            'open_interest': oi_df['open_interest'].to_numpy()[change_idx],
+            'change': changes,
+            'pct_change': pct_change[change_idx],
+            'type': 'oi_change',
+            'direction': np.where(changes > 0, 'increase', 'decrease')
+        })
+        
+        return change_df
+    
+    def _get_volume_stats(self, contract, lookback_period):
+        """
+        Get date-sorted volume data and its rolling average for a contract
+        
+        Args:
+            contract (str): Contract symbol
+            lookback_period (int): Number of days in the rolling window
+            
+        Returns:
+            tuple: (volume_df, volume, avg_volume) sorted frame and float64 arrays
+        """
+        volume_df = self.volume_data[contract]
+        key = ("volume", contract, lookback_period)
+        
+        with self._data_lock:
+            cached = self._stats_cache.get(key)
+        if cached is not None and cached[0] is volume_df:
+            return cached[1:]
+        
+        # Sort by date (fetched data is already in date order, so usually no copy is made)
+        sorted_df = volume_df
+        if not sorted_df['date'].is_monotonic_increasing:
+            sorted_df = sorted_df.sort_values('date', kind='mergesort')
+        volume = sorted_df['volume'].to_numpy(dtype=np.float64)
+        avg_volume = rolling_mean(volume, lookback_period)
+        
+        with self._data_lock:
+            self._stats_cache[key] = (volume_df, sorted_df, volume, avg_volume)
+        
+        return sorted_df, volume, avg_volume
+    
+    def _get_oi_stats(self, contract):
+        """
+        Get date-sorted open interest data for a contract
+        
+        Args:
+            contract (str): Contract symbol
+            
+        Returns:
+            tuple: (oi_df, change, open_interest) sorted frame and float64 arrays
+        """
+        oi_df = self.oi_data[contract]
+        key = ("oi", contract)
+        
+        with self._data_lock:
+            cached = self._stats_cache.get(key)
+        if cached is not None and cached[0] is oi_df:
+            return cached[1:]
+        
+        # Sort by date (fetched data is already in date order, so usually no copy is made)
+        sorted_df = oi_df
+        if not sorted_df['date'].is_monotonic_increasing:
+            sorted_df = sorted_df.sort_values('date', kind='mergesort')
+        change = sorted_df['change'].to_numpy(dtype=np.float64)
+        open_interest = sorted_df['open_interest'].to_numpy(dtype=np.float64)
         
-        return change_events
+        with self._data_lock:
+            self._stats_cache[key] = (oi_df, sorted_df, change, open_interest)
+        
+        return sorted_df, change, open_interest
     
     def check_economic_events(self, date):
         """
@@ -268,31 +468,32 @@ class CMEVolumeTracker:
             list: List of nearby economic events
         """
         nearby_events = []
-        date_str = date.strftime("%Y-%m-%d")
+        date_ns = np.datetime64(date, 'ns')
+        date_day = date_ns.astype("datetime64[D]")
         
         # Check FOMC meetings
-        for fomc_date in self.config["economic_calendar"]["fomc_meetings"]:
-            days_diff = abs((date - datetime.strptime(fomc_date, "%Y-%m-%d")).days)
-            if days_diff <= 3:  # Within 3 days
-                nearby_events.append({
-                    'type': 'FOMC Meeting',
-                    'date': fomc_date,
-                    'days_away': days_diff
-                })
+        fomc_diff = np.abs((date_day - self._fomc_days).astype(np.int64))
+        for i in np.flatnonzero(fomc_diff <= 3):  # Within 3 days
+            nearby_events.append({
+                'type': 'FOMC Meeting',
+                'date': self._fomc_dt[i][1],
+                'days_away': int(fomc_diff[i])
+            })
         
         # Check earnings seasons
-        for season in self.config["economic_calendar"]["earnings_seasons"]:
-            start_date = datetime.strptime(season["start"], "%Y-%m-%d")
-            end_date = datetime.strptime(season["end"], "%Y-%m-%d")
+        in_season = (self._earnings_start_dt64 <= date_ns) & (date_ns <= self._earnings_end_dt64)
+        near_start = np.abs((date_day - self._earnings_start_days).astype(np.int64)) <= 5  # Within 5 days of start
+        for i in np.flatnonzero(in_season | near_start):
+            start_date, end_date, season = self._earnings_dt[i]
             
-            if start_date <= date <= end_date:
+            if in_season[i]:
                 nearby_events.append({
                     'type': 'Earnings Season',
                     'description': season["description"],
                     'start_date': season["start"],
                     'end_date': season["end"]
                 })
-            elif abs((date - start_date).days) <= 5:  # Within 5 days of start
+            else:
                 nearby_events.append({
                     'type': 'Upcoming Earnings Season',
                     'description': season["description"],
@@ -301,17 +502,15 @@ class CMEVolumeTracker:
                 })
         
         # Check economic releases
-        for release in self.config["economic_calendar"]["economic_releases"]:
-            release_date = datetime.strptime(release["date"], "%Y-%m-%d")
-            days_diff = abs((date - release_date).days)
-            
-            if days_diff <= 2:  # Within 2 days
-                nearby_events.append({
-                    'type': 'Economic Release',
-                    'description': release["description"],
-                    'date': release["date"],
-                    'days_away': days_diff
-                })
+        release_diff = np.abs((date_day - self._releases_days).astype(np.int64))
+        for i in np.flatnonzero(release_diff <= 2):  # Within 2 days
+            release = self._releases_dt[i][1]
+            nearby_events.append({
+                'type': 'Economic Release',
+                'description': release["description"],
+                'date': release["date"],
+                'days_away': int(release_diff[i])
+            })
         
         return nearby_events
     
@@ -328,55 +527,77 @@ class CMEVolumeTracker:
         if contracts is None:
             contracts = list(self.config["contracts"].keys())
         
-        all_alerts = []
+        # Use one timestamp for the whole run so every contract shares the same window
+        now = datetime.now()
         
-        for contract in contracts:
-            # Fetch data if not already available
-            if contract not in self.volume_data or contract not in self.oi_data:
-                self.fetch_cme_data(contract)
-            
-            # Detect volume spikes
-            volume_spikes = self.detect_volume_spikes(contract)
-            
-            # Detect OI changes
-            oi_changes = self.detect_oi_changes(contract)
-            
-            # Combine events
-            events = volume_spikes + oi_changes
-            
-            # Sort by date
-            events.sort(key=lambda x: x['date'], reverse=True)
-            
-            # Filter to recent events
-            alert_period = self.config["thresholds"]["alert_period"]
-            cutoff_date = datetime.now() - timedelta(days=alert_period)
-            recent_events = [e for e in events if e['date'] > cutoff_date]
-            
-            # Check for economic events
-            for event in recent_events:
-                economic_events = self.check_economic_events(event['date'])
-                event['economic_events'] = economic_events
-                
-                # Create alert message
-                alert_message = self._create_alert_message(event)
-                
-                # Add to alerts
-                alert = {
-                    'date': event['date'],
-                    'contract': contract,
-                    'event_type': event['type'],
-                    'message': alert_message,
-                    'details': event,
-                    'economic_context': economic_events
-                }
-                
-                all_alerts.append(alert)
+        # Contracts are independent, so fetch and detect them concurrently
+        with ThreadPoolExecutor(max_workers=max(len(contracts), 1)) as executor:
+            contract_alerts = list(executor.map(partial(self._generate_contract_alerts, now=now), contracts))
+        
+        all_alerts = [alert for alerts in contract_alerts for alert in alerts]
         
         # Store alerts
         self.alerts = all_alerts
         
         return all_alerts
     
+    def _generate_contract_alerts(self, contract, now):
+        """
+        Generate alerts for a single contract
+        
+        Args:
+            contract (str): Contract symbol
+            now (datetime): Reference time for the data window and alert cutoff
+            
+        Returns:
+            list: List of alerts for the contract
+        """
+        contract_alerts = []
+        
+        # Fetch data if not already available
+        if contract not in self.volume_data or contract not in self.oi_data:
+            self.fetch_cme_data(contract, now=now)
+        
+        # Detect volume spikes and OI changes
+        event_frames = [
+            self._detect_volume_spikes_frame(contract),
+            self._detect_oi_changes_frame(contract)
+        ]
+        
+        # Filter each frame to recent events before building dicts. The frames are
+        # converted separately since their columns differ.
+        alert_period = self.config["thresholds"]["alert_period"]
+        cutoff_date = now - timedelta(days=alert_period)
+        recent_events = []
+        for events_df in event_frames:
+            if events_df is not None:
+                recent_events.extend(events_df[events_df['date'] > cutoff_date].to_dict(orient='records'))
+        
+        # Sort by date
+        recent_events.sort(key=lambda x: x['date'], reverse=True)
+        
+        # Check for economic events
+        for event in recent_events:
+            economic_events = self.check_economic_events(event['date'])
+            event['economic_events'] = economic_events
+            
+            # Create alert message
+            alert_message = self._create_alert_message(event)
+            
+            # Add to alerts
+            alert = {
+                'date': event['date'],
+                'contract': contract,
+                'event_type': event['type'],
+                'message': alert_message,
+                'details': event,
+                'economic_context': economic_events
+            }
+            
+            contract_alerts.append(alert)
+        
+        return contract_alerts
+    
     def _create_alert_message(self, event):
         """
         Create alert message for an event
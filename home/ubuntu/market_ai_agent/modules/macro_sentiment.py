@@ -8,16 +8,199 @@ This module is responsible for:
 """
 
 import os
+import io
 import re
 import json
+import time
+import asyncio
+import weakref
+import contextlib
 import datetime
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import httpx
 import numpy as np
 from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+from modules.cache import FileCache, cached
+
+# Last price on a CNBC quote page (this pattern might need adjustment based on CNBC's HTML structure)
+_PRICE_RE = re.compile(rb'QuoteStrip-lastPrice[^>]*>\s*([0-9.,]+)\s*<')
+
+
+def _parse_last_price(html):
+    """
+    Extract the last price from a CNBC quote page
+    
+    The precompiled regex handles the usual markup. If it does not match (e.g. the
+    price is wrapped in nested tags), the page is streamed through lxml and parsing
+    stops at the first QuoteStrip-lastPrice element, so only the prefix of the page
+    is parsed.
+    
+    Args:
+        html (bytes): Raw page body
+        
+    Returns:
+        float: Last price, or None if it could not be found on the page
+    """
+    match = _PRICE_RE.search(html)
+    if match:
+        return float(match.group(1).replace(b",", b""))
+    
+    if etree is None:
+        return None
+    
+    try:
+        for _, element in etree.iterparse(io.BytesIO(html), events=("end",), html=True, recover=True):
+            if "QuoteStrip-lastPrice" in (element.get("class") or "").split():
+                return float("".join(element.itertext()).strip().replace(",", ""))
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+    
+    return None
+
+# Headers sent with every quote page request
+_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; MarketAIAgent/1.0)",
+    "Accept-Encoding": "gzip, deflate"
+}
+
+# Connect/read timeouts in seconds, so a stalled server cannot hang the analyzer
+_HTTP_TIMEOUT = httpx.Timeout(10, connect=3)
+
+# Connection pool shared by all requests of one client
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=8)
+
+# Concurrent requests per host, retried statuses, and backoff (seconds) for polite scraping
+_MAX_REQUESTS_PER_HOST = 4
+_RETRY_STATUSES = (429, 502, 503, 504)
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.3
+_MAX_RETRY_AFTER = 30
+
+# Links to FOMC minutes on the calendar page, e.g. fomcminutes20250319.htm
+_MINUTES_LINK_RE = re.compile(r'fomcminutes(\d{8})\.htm')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Hawkish (positive) and dovish (negative) phrases in Fed minutes and their weights
+_FED_KEYWORDS = {
+    "inflationary pressures": 0.8,
+    "upside risks to inflation": 0.7,
+    "elevated inflation": 0.6,
+    "further tightening": 0.8,
+    "additional policy firming": 0.8,
+    "restrictive": 0.4,
+    "tight labor market": 0.4,
+    "rate increase": 0.7,
+    "rate cut": -0.7,
+    "policy easing": -0.6,
+    "accommodative": -0.5,
+    "downside risks": -0.4,
+    "softening labor market": -0.4,
+    "slowing economic growth": -0.4,
+    "disinflation": -0.6
+}
+
+
+def _build_fed_matcher():
+    """Build an Aho-Corasick automaton over the Fed keywords, or None without pyahocorasick"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _FED_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+# All keywords scanned in one pass over the text
+_FED_AUTOMATON = _build_fed_matcher()
+_FED_KEYWORD_RE = re.compile(r'\b(?:' + '|'.join(sorted(map(re.escape, _FED_KEYWORDS), key=len, reverse=True)) + r')\b')
+
+
+# Mock data for demonstration, built once; callers get copies they are free to modify
+_MOCK_ECONOMIC_DATA = {
+    "cpi": {
+        "latest": 3.2,
+        "previous": 3.1,
+        "yoy_change": 3.2,
+        "date": "2025-03-15"
+    },
+    "core_cpi": {
+        "latest": 2.8,
+        "previous": 2.9,
+        "yoy_change": 2.8,
+        "date": "2025-03-15"
+    },
+    "ppi": {
+        "latest": 2.5,
+        "previous": 2.7,
+        "yoy_change": 2.5,
+        "date": "2025-03-10"
+    },
+    "core_pce": {
+        "latest": 2.2,
+        "previous": 2.3,
+        "yoy_change": 2.2,
+        "date": "2025-03-01"
+    },
+    "unemployment": {
+        "latest": 3.8,
+        "previous": 3.7,
+        "mom_change": 0.1,
+        "date": "2025-04-05"
+    },
+    "gdp": {
+        "latest": 2.1,
+        "previous": 2.3,
+        "qoq_change": -0.2,
+        "date": "2025-03-30"
+    }
+}
+
+_MOCK_FED_ANALYSIS = {
+    "latest_meeting": "2025-03-20",
+    "next_meeting": "2025-05-01",
+    "rate_decision": "hold",
+    "key_themes": [
+        "inflation concerns",
+        "labor market strength",
+        "global economic uncertainty"
+    ],
+    "hawkish_dovish_score": 0.2,  # Positive is hawkish, negative is dovish
+    "rate_hike_probability": 0.3,
+    "rate_cut_probability": 0.1
+}
+
+
+@dataclass(slots=True)
+class MacroHistory:
+    """Columnar history of raw indicator values for vectorized rating (NaN where missing)"""
+    timestamp: np.ndarray
+    vix: np.ndarray
+    yield_spread: np.ndarray
+    cpi_yoy: np.ndarray
+    gdp_qoq: np.ndarray
+
 
 class MacroSentimentAnalyzer:
+    # Labels of the overall environment codes returned by rate_macro_environment_batch
+    ENVIRONMENT_LABELS = ("bullish", "bearish", "neutral")
+    
     def __init__(self, config_path=None):
         """
         Initialize the Macro Sentiment Analyzer
@@ -43,6 +226,7 @@ class MacroSentimentAnalyzer:
                 },
                 "economic_data": {
                     "fred_api_key": "YOUR_FRED_API_KEY",  # User should replace this
+                    "url": "https://api.stlouisfed.org/fred/series/observations",
                     "series": {
                         "cpi": "CPIAUCSL",
                         "core_cpi": "CPILFESL",
@@ -64,6 +248,12 @@ class MacroSentimentAnalyzer:
                 "yield_curve": {
                     "inversion": -0.1  # 10Y-2Y spread below -0.1 is considered inverted
                 }
+            },
+            "cache_dir": os.path.join(".cache", "macro"),
+            "cache_ttls": {
+                "quotes": 300,            # VIX and Treasury yields: 5 minutes
+                "economic_data": 86400,   # CPI, PPI, PCE, etc.: 24 hours
+                "fed_minutes": 604800     # Fed minutes: 7 days
             }
         }
         
@@ -73,32 +263,289 @@ class MacroSentimentAnalyzer:
                 custom_config = json.load(f)
                 self.config.update(custom_config)
         
+        # Denormalize hot configuration values into instance attributes
+        self.reload_config()
+        
+        # Pooled keep-alive HTTP client for the threaded (non-asyncio) fetch path
+        self._session = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True, limits=_HTTP_LIMITS, retries=_RETRY_ATTEMPTS),
+            headers=_HTTP_HEADERS,
+            timeout=_HTTP_TIMEOUT
+        )
+        
         # Initialize data storage
         self.indicators = {}
         self.environment_rating = {}
         self.es_bias = None
         
-    def fetch_vix(self):
+        # Shared timestamp of the current refresh cycle (None outside a cycle)
+        self._now = None
+        
+        # Per-host request semaphores for each event loop
+        self._host_semaphores = weakref.WeakKeyDictionary()
+        
+    def reload_config(self):
+        """
+        Rebuild the attributes derived from self.config
+        
+        Call this after changing self.config so URLs, thresholds and the cache
+        directory pick up the new values.
+        """
+        indicators = self.config["indicators"]
+        economic_config = indicators["economic_data"]
+        
+        self._vix_url = indicators["vix"]["url"]
+        self._yield_urls = dict(indicators["treasury_yields"]["urls"])
+        self._fred_url = economic_config["url"]
+        self._fred_series = dict(economic_config["series"])
+        self._fred_params = {
+            "api_key": economic_config["fred_api_key"],
+            "file_type": "json",
+            "sort_order": "desc",
+            "limit": 24  # Headroom for missing (".") observations
+        }
+        self._fed_calendar_url = indicators["fed_minutes"]["url"]
+        
+        # Threshold lookups for the interpretation methods
+        self._build_interpretation_bins()
+        
+        # Cache for fetched indicator values
+        self._cache = FileCache(self.config["cache_dir"])
+    
+    def _build_interpretation_bins(self):
+        """
+        Precompute threshold arrays and labels for the interpretation lookups
+        
+        Each lookup is labels[np.searchsorted(bins, value, side='right')]. A strict
+        "greater than" threshold is stored as the next float above it so the same
+        search applies.
+        """
+        vix_config = self.config["indicators"]["vix"]
+        inflation_thresholds = self.config["thresholds"]["inflation"]
+        
+        self._vix_bins = np.array([vix_config["threshold_low"], np.nextafter(vix_config["threshold_high"], np.inf)])
+        self._vix_labels = ("low_volatility", "normal_volatility", "high_volatility")
+        
+        self._yield_curve_bins = np.array([self.config["thresholds"]["yield_curve"]["inversion"], 0.5])
+        self._yield_curve_labels = ("inverted", "flat", "normal")
+        
+        self._inflation_bins = np.array([inflation_thresholds["low"], np.nextafter(inflation_thresholds["high"], np.inf)])
+        self._inflation_labels = ("low", "moderate", "high")
+        
+        self._growth_bins = np.array([0.0, 1.0, 3.0])
+        self._growth_labels = ("contracting", "slow", "moderate", "strong")
+        
+        self._labor_market_bins = np.array([4.0, 6.0])
+        self._labor_market_labels = ("tight", "balanced", "loose")
+        
+        # Interpretations are pure functions of their inputs, so repeated values are served
+        # from a cache. The caches are rebuilt with the bins, so thresholds can't go stale.
+        self._vix_label = lru_cache(maxsize=256)(partial(self._lookup, self._vix_bins, self._vix_labels))
+        self._yield_curve_label = lru_cache(maxsize=256)(partial(self._lookup, self._yield_curve_bins, self._yield_curve_labels))
+    
+    def _lookup(self, bins, labels, value):
+        """Map a value to the label of the threshold bin it falls in"""
+        return labels[int(np.searchsorted(bins, value, side='right'))]
+    
+    @contextlib.contextmanager
+    def refresh_cycle(self):
+        """
+        Run a refresh cycle in which every indicator, rating and bias carries one timestamp
+        
+        Wrap a full analysis run (e.g. run_analysis) in this context; the
+        timestamp is taken on entry and released on exit, even if a step raises.
+        """
+        self._now = datetime.now()
+        try:
+            yield self._now
+        finally:
+            self._now = None
+    
+    def _timestamp(self):
+        """Get the timestamp for new results: the cycle's during a refresh, otherwise the current time"""
+        return self._now if self._now is not None else datetime.now()
+    
+    async def fetch_all_async(self, force_refresh=False):
+        """
+        Fetch VIX and Treasury yields concurrently over one HTTP session
+        
+        Args:
+            force_refresh (bool): Whether to bypass cached quotes
+            
+        Returns:
+            tuple: (vix_value, yields) as returned by fetch_vix and fetch_treasury_yields
+        """
+        async with self._client_session() as session:
+            vix_value, yields = await asyncio.gather(
+                self._fetch_vix_async(session, force_refresh),
+                self._fetch_treasury_yields_async(session, force_refresh)
+            )
+        
+        return vix_value, yields
+    
+    def fetch_all(self, force_refresh=False):
+        """
+        Fetch VIX and Treasury yields concurrently
+        
+        Args:
+            force_refresh (bool): Whether to bypass cached quotes
+            
+        Returns:
+            tuple: (vix_value, yields) as returned by fetch_vix and fetch_treasury_yields
+        """
+        return asyncio.run(self.fetch_all_async(force_refresh))
+    
+    def _client_session(self):
+        """Create the HTTP/2 client shared by concurrent quote fetches"""
+        return httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=_HTTP_LIMITS, retries=_RETRY_ATTEMPTS),
+            headers=_HTTP_HEADERS,
+            timeout=_HTTP_TIMEOUT
+        )
+    
+    def _loop_running(self):
+        """Check whether an asyncio event loop is already running in this thread"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+    
+    async def _with_session(self, fetch):
+        """Run a single fetch coroutine function with its own HTTP session"""
+        async with self._client_session() as session:
+            return await fetch(session)
+    
+    def _host_semaphore(self, url):
+        """Get the semaphore limiting concurrent requests to the URL's host"""
+        semaphores = self._host_semaphores.setdefault(asyncio.get_running_loop(), {})
+        host = urlsplit(url).netloc
+        if host not in semaphores:
+            semaphores[host] = asyncio.Semaphore(_MAX_REQUESTS_PER_HOST)
+        return semaphores[host]
+    
+    def _retry_delay(self, response, attempt):
+        """
+        Get the delay before retrying a request
+        
+        Args:
+            response (httpx.Response): Response to the failed attempt
+            attempt (int): Zero-based attempt number
+            
+        Returns:
+            float: Delay in seconds, or None if the response should not be retried
+        """
+        if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+            return None
+        
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), _MAX_RETRY_AFTER)
+        return _RETRY_BACKOFF * 2 ** attempt
+    
+    async def _fetch_page(self, session, url):
+        """
+        Fetch the raw body of a page
+        
+        Throttled and server error responses are retried with exponential backoff,
+        honoring Retry-After when the server sends it.
+        
+        Args:
+            session (httpx.AsyncClient): HTTP client
+            url (str): Page URL
+            
+        Returns:
+            bytes: Page body
+        """
+        async with self._host_semaphore(url):
+            for attempt in range(_RETRY_ATTEMPTS + 1):
+                response = await session.get(url)
+                delay = self._retry_delay(response, attempt)
+                if delay is None:
+                    response.raise_for_status()
+                    return response.content
+                
+                await asyncio.sleep(delay)
+    
+    def _get(self, url, params=None):
+        """
+        Send a GET request with the threaded client, retrying like _fetch_page
+        
+        Args:
+            url (str): Request URL
+            params (dict): Query parameters
+            
+        Returns:
+            httpx.Response: Successful response
+        """
+        for attempt in range(_RETRY_ATTEMPTS + 1):
+            response = self._session.get(url, params=params)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                response.raise_for_status()
+                return response
+            
+            time.sleep(delay)
+    
+    @cached("quote", "quotes", ignore=("session",))
+    async def _fetch_quote_async(self, session, url):
+        """
+        Fetch the last price from a CNBC quote page
+        
+        Args:
+            session (httpx.AsyncClient): HTTP client
+            url (str): Quote page URL
+            
+        Returns:
+            float: Last price, or None if it could not be found on the page
+        """
+        html = await self._fetch_page(session, url)
+        
+        return _parse_last_price(html)
+    
+    @cached("quote", "quotes")
+    def _fetch_quote(self, url):
+        """
+        Fetch the last price from a CNBC quote page without asyncio
+        
+        Args:
+            url (str): Quote page URL
+            
+        Returns:
+            float: Last price, or None if it could not be found on the page
+        """
+        return _parse_last_price(self._get(url).content)
+    
+    def fetch_vix(self, force_refresh=False):
         """
         Fetch current VIX value
         
+        Args:
+            force_refresh (bool): Whether to bypass the cached quote
+            
+        Returns:
+            float: Current VIX value
+        """
+        return asyncio.run(self._with_session(partial(self._fetch_vix_async, force_refresh=force_refresh)))
+    
+    async def _fetch_vix_async(self, session, force_refresh=False):
+        """
+        Fetch current VIX value using an existing HTTP session
+        
+        Args:
+            session (httpx.AsyncClient): HTTP client
+            force_refresh (bool): Whether to bypass the cached quote
+            
         Returns:
             float: Current VIX value
         """
         try:
-            url = self.config["indicators"]["vix"]["url"]
-            response = requests.get(url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find the VIX value (this selector might need adjustment based on CNBC's HTML structure)
-            vix_element = soup.select_one(".QuoteStrip-lastPrice")
-            if vix_element:
-                vix_value = float(vix_element.text.strip())
-                
+            vix_value = await self._fetch_quote_async(session, self._vix_url, force_refresh=force_refresh)
+            if vix_value is not None:
                 # Store the value
                 self.indicators["vix"] = {
                     "value": vix_value,
-                    "timestamp": datetime.now(),
+                    "timestamp": self._timestamp(),
                     "interpretation": self._interpret_vix(vix_value)
                 }
                 
@@ -121,58 +568,135 @@ class MacroSentimentAnalyzer:
         Returns:
             str: Interpretation of VIX value
         """
-        threshold_low = self.config["indicators"]["vix"]["threshold_low"]
-        threshold_high = self.config["indicators"]["vix"]["threshold_high"]
-        
-        if vix_value < threshold_low:
-            return "low_volatility"
-        elif vix_value > threshold_high:
-            return "high_volatility"
-        else:
-            return "normal_volatility"
+        return self._vix_label(vix_value)
     
-    def fetch_treasury_yields(self):
+    def fetch_treasury_yields(self, force_refresh=False):
         """
         Fetch current Treasury yields
         
+        Args:
+            force_refresh (bool): Whether to bypass cached quotes
+            
         Returns:
             dict: Dictionary of Treasury yields
         """
-        yields = {}
+        # asyncio.run cannot be nested, so use threads when called from a running event loop
+        if self._loop_running():
+            return self._fetch_treasury_yields_threaded(force_refresh)
+        return asyncio.run(self._with_session(partial(self._fetch_treasury_yields_async, force_refresh=force_refresh)))
+    
+    def _fetch_treasury_yields_threaded(self, force_refresh=False):
+        """
+        Fetch current Treasury yields with one worker thread per tenor
         
+        Args:
+            force_refresh (bool): Whether to bypass cached quotes
+            
+        Returns:
+            dict: Dictionary of Treasury yields
+        """
         try:
-            for tenor, url in self.config["indicators"]["treasury_yields"]["urls"].items():
-                response = requests.get(url)
-                soup = BeautifulSoup(response.text, 'html.parser')
+            urls = self._yield_urls
+            with ThreadPoolExecutor(max_workers=max(len(urls), 1)) as executor:
+                results = dict(executor.map(partial(self._fetch_one_yield, force_refresh=force_refresh), urls.items()))
+            
+            return self._store_treasury_yields(results)
                 
-                # Find the yield value (this selector might need adjustment based on CNBC's HTML structure)
-                yield_element = soup.select_one(".QuoteStrip-lastPrice")
-                if yield_element:
-                    yield_value = float(yield_element.text.strip())
-                    yields[tenor] = yield_value
-                else:
-                    print(f"Could not find {tenor} Treasury yield on the page")
-            
-            # Calculate spreads
-            if '2y' in yields and '10y' in yields:
-                yields['10y_2y_spread'] = yields['10y'] - yields['2y']
-            
-            if '10y' in yields and '30y' in yields:
-                yields['30y_10y_spread'] = yields['30y'] - yields['10y']
-            
-            # Store the values
-            self.indicators["treasury_yields"] = {
-                "values": yields,
-                "timestamp": datetime.now(),
-                "interpretation": self._interpret_yield_curve(yields)
-            }
+        except Exception as e:
+            print(f"Error fetching Treasury yields: {str(e)}")
+            return {}
+    
+    def _fetch_one_yield(self, item, force_refresh=False):
+        """
+        Fetch a single Treasury yield without asyncio
+        
+        Args:
+            item (tuple): (tenor, url) pair
+            force_refresh (bool): Whether to bypass the cached quote
             
-            return yields
+        Returns:
+            tuple: (tenor, yield value or None)
+        """
+        tenor, url = item
+        try:
+            yield_value = self._fetch_quote(url, force_refresh=force_refresh)
+        except Exception as e:
+            print(f"Error fetching {tenor} Treasury yield: {str(e)}")
+            return tenor, None
+        
+        if yield_value is None:
+            print(f"Could not find {tenor} Treasury yield on the page")
+        return tenor, yield_value
+    
+    async def _fetch_treasury_yields_async(self, session, force_refresh=False):
+        """
+        Fetch current Treasury yields using an existing HTTP session
+        
+        All tenors are requested concurrently.
+        
+        Args:
+            session (httpx.AsyncClient): HTTP client
+            force_refresh (bool): Whether to bypass cached quotes
+            
+        Returns:
+            dict: Dictionary of Treasury yields
+        """
+        try:
+            urls = self._yield_urls
+            values = await asyncio.gather(*[self._fetch_yield_async(session, tenor, url, force_refresh) for tenor, url in urls.items()])
+            
+            return self._store_treasury_yields(dict(zip(urls, values)))
                 
         except Exception as e:
             print(f"Error fetching Treasury yields: {str(e)}")
             return {}
     
+    def _store_treasury_yields(self, values):
+        """
+        Calculate spreads from fetched yields and store the indicator
+        
+        Args:
+            values (dict): Yield value (or None) for each tenor
+            
+        Returns:
+            dict: Dictionary of Treasury yields
+        """
+        yields = {tenor: yield_value for tenor, yield_value in values.items() if yield_value is not None}
+        
+        # Calculate spreads
+        if '2y' in yields and '10y' in yields:
+            yields['10y_2y_spread'] = yields['10y'] - yields['2y']
+        
+        if '10y' in yields and '30y' in yields:
+            yields['30y_10y_spread'] = yields['30y'] - yields['10y']
+        
+        # Store the values
+        self.indicators["treasury_yields"] = {
+            "values": yields,
+            "timestamp": self._timestamp(),
+            "interpretation": self._interpret_yield_curve(yields)
+        }
+        
+        return yields
+    
+    async def _fetch_yield_async(self, session, tenor, url, force_refresh=False):
+        """
+        Fetch a single Treasury yield
+        
+        Args:
+            session (httpx.AsyncClient): HTTP client
+            tenor (str): Tenor label (e.g., "10y")
+            url (str): Quote page URL
+            force_refresh (bool): Whether to bypass the cached quote
+            
+        Returns:
+            float: Yield value, or None if it could not be found on the page
+        """
+        yield_value = await self._fetch_quote_async(session, url, force_refresh=force_refresh)
+        if yield_value is None:
+            print(f"Could not find {tenor} Treasury yield on the page")
+        return yield_value
+    
     def _interpret_yield_curve(self, yields):
         """
         Interpret yield curve
@@ -184,87 +708,143 @@ class MacroSentimentAnalyzer:
             str: Interpretation of yield curve
         """
         if '10y_2y_spread' in yields:
-            spread = yields['10y_2y_spread']
-            inversion_threshold = self.config["thresholds"]["yield_curve"]["inversion"]
-            
-            if spread < inversion_threshold:
-                return "inverted"
-            elif spread < 0.5:
-                return "flat"
-            else:
-                return "normal"
+            return self._yield_curve_label(yields['10y_2y_spread'])
         else:
             return "unknown"
     
-    def fetch_economic_data(self, use_mock_data=True):
+    def fetch_economic_data(self, use_mock_data=True, force_refresh=False):
         """
         Fetch economic data from FRED
         
         Args:
             use_mock_data (bool): Whether to use mock data instead of actual API calls
+            force_refresh (bool): Whether to bypass the cached data
             
         Returns:
             dict: Dictionary of economic data
         """
-        economic_data = {}
-        
         # For demonstration purposes, we'll use mock data
         # In a real implementation, you would use the FRED API with an API key
         if use_mock_data:
-            # Mock data for demonstration
-            economic_data = {
-                "cpi": {
-                    "latest": 3.2,
-                    "previous": 3.1,
-                    "yoy_change": 3.2,
-                    "date": "2025-03-15"
-                },
-                "core_cpi": {
-                    "latest": 2.8,
-                    "previous": 2.9,
-                    "yoy_change": 2.8,
-                    "date": "2025-03-15"
-                },
-                "ppi": {
-                    "latest": 2.5,
-                    "previous": 2.7,
-                    "yoy_change": 2.5,
-                    "date": "2025-03-10"
-                },
-                "core_pce": {
-                    "latest": 2.2,
-                    "previous": 2.3,
-                    "yoy_change": 2.2,
-                    "date": "2025-03-01"
-                },
-                "unemployment": {
-                    "latest": 3.8,
-                    "previous": 3.7,
-                    "mom_change": 0.1,
-                    "date": "2025-04-05"
-                },
-                "gdp": {
-                    "latest": 2.1,
-                    "previous": 2.3,
-                    "qoq_change": -0.2,
-                    "date": "2025-03-30"
-                }
-            }
+            economic_data = {key: dict(values) for key, values in _MOCK_ECONOMIC_DATA.items()}
         else:
             # Use FRED API to fetch actual data
-            # This would require an API key and proper implementation
-            # For now, we'll leave this as a placeholder
-            pass
+            economic_data = self._fetch_fred_data(force_refresh)
         
         # Store the data
         self.indicators["economic_data"] = {
             "values": economic_data,
-            "timestamp": datetime.now(),
+            "timestamp": self._timestamp(),
             "interpretation": self._interpret_economic_data(economic_data)
         }
         
         return economic_data
     
+    def _fetch_fred_data(self, force_refresh=False):
+        """
+        Fetch all configured FRED series concurrently
+        
+        Args:
+            force_refresh (bool): Whether to bypass cached series
+            
+        Returns:
+            dict: Dictionary of economic data in the same format as the mock data
+        """
+        series = self._fred_series
+        with ThreadPoolExecutor(max_workers=max(len(series), 1)) as executor:
+            results = list(executor.map(partial(self._fetch_one_fred_series, force_refresh=force_refresh), series.items()))
+        
+        economic_data = {}
+        for name, observations in results:
+            if observations:
+                parsed = self._parse_fred_observations(name, observations)
+                if parsed:
+                    economic_data[name] = parsed
+        
+        return economic_data
+    
+    def _fetch_one_fred_series(self, item, force_refresh=False):
+        """
+        Fetch a single FRED series
+        
+        Args:
+            item (tuple): (name, series_id) pair
+            force_refresh (bool): Whether to bypass the cached series
+            
+        Returns:
+            tuple: (name, observations or None)
+        """
+        name, series_id = item
+        try:
+            return name, self._fetch_fred_series(series_id, force_refresh=force_refresh)
+        except Exception as e:
+            print(f"Error fetching FRED series {series_id}: {str(e)}")
+            return name, None
+    
+    @cached("fred_series", "economic_data")
+    def _fetch_fred_series(self, series_id):
+        """
+        Fetch the latest observations of a FRED series
+        
+        Args:
+            series_id (str): FRED series ID (e.g., "CPIAUCSL")
+            
+        Returns:
+            list: [date, value] pairs, newest first, without missing values
+        """
+        response = self._get(self._fred_url, params={**self._fred_params, "series_id": series_id})
+        
+        return [[obs["date"], float(obs["value"])] for obs in response.json()["observations"] if obs["value"] != "."]
+    
+    def _parse_fred_observations(self, name, observations):
+        """
+        Derive the latest/previous readings from FRED observations
+        
+        Price indices are reported as YoY percentage change, GDP as annualized QoQ
+        growth, and unemployment as the rate itself.
+        
+        Args:
+            name (str): Indicator name (e.g., "cpi")
+            observations (list): [date, value] pairs, newest first
+            
+        Returns:
+            dict: Parsed indicator data, or None if there are too few observations
+        """
+        date = observations[0][0]
+        values = np.array([value for _, value in observations])
+        
+        if name == "unemployment":
+            if len(values) < 2:
+                return None
+            return {
+                "latest": round(float(values[0]), 2),
+                "previous": round(float(values[1]), 2),
+                "mom_change": round(float(values[0] - values[1]), 2),
+                "date": date
+            }
+        
+        if name == "gdp":
+            if len(values) < 3:
+                return None
+            growth = ((values[:2] / values[1:3]) ** 4 - 1) * 100
+            return {
+                "latest": round(float(growth[0]), 2),
+                "previous": round(float(growth[1]), 2),
+                "qoq_change": round(float(growth[0] - growth[1]), 2),
+                "date": date
+            }
+        
+        # Monthly price indices: compare with the same month a year earlier
+        if len(values) < 14:
+            return None
+        yoy = (values[:2] / values[12:14] - 1) * 100
+        return {
+            "latest": round(float(yoy[0]), 2),
+            "previous": round(float(yoy[1]), 2),
+            "yoy_change": round(float(yoy[0]), 2),
+            "date": date
+        }
+    
     def _interpret_economic_data(self, economic_data):
         """
         Interpret economic data
@@ -280,48 +860,61 @@ class MacroSentimentAnalyzer:
         # Interpret inflation
         if "cpi" in economic_data:
             cpi_yoy = economic_data["cpi"]["yoy_change"]
-            high_threshold = self.config["thresholds"]["inflation"]["high"]
-            low_threshold = self.config["thresholds"]["inflation"]["low"]
-            
-            if cpi_yoy > high_threshold:
-                interpretation["inflation"] = "high"
-            elif cpi_yoy < low_threshold:
-                interpretation["inflation"] = "low"
-            else:
+            if np.isnan(cpi_yoy):
+                # A missing reading is neither above nor below the thresholds
                 interpretation["inflation"] = "moderate"
+            else:
+                interpretation["inflation"] = self._lookup(self._inflation_bins, self._inflation_labels, cpi_yoy)
         
         # Interpret GDP growth
         if "gdp" in economic_data:
             gdp_qoq = economic_data["gdp"]["qoq_change"]
-            
-            if gdp_qoq < 0:
-                interpretation["growth"] = "contracting"
-            elif gdp_qoq < 1.0:
-                interpretation["growth"] = "slow"
-            elif gdp_qoq < 3.0:
-                interpretation["growth"] = "moderate"
-            else:
-                interpretation["growth"] = "strong"
+            interpretation["growth"] = self._lookup(self._growth_bins, self._growth_labels, gdp_qoq)
         
         # Interpret unemployment
         if "unemployment" in economic_data:
             unemployment = economic_data["unemployment"]["latest"]
-            
-            if unemployment < 4.0:
-                interpretation["labor_market"] = "tight"
-            elif unemployment < 6.0:
-                interpretation["labor_market"] = "balanced"
-            else:
-                interpretation["labor_market"] = "loose"
+            interpretation["labor_market"] = self._lookup(self._labor_market_bins, self._labor_market_labels, unemployment)
         
         return interpretation
     
-    def fetch_fed_minutes(self, use_mock_data=True):
+    def interpret_economic_data_batch(self, df):
+        """
+        Interpret economic data for many dates at once
+        
+        Args:
+            df (pd.DataFrame): One row per date with any of the columns "cpi" (YoY change),
+                "gdp" (QoQ change) and "unemployment" (latest rate)
+            
+        Returns:
+            pd.DataFrame: Categorical "inflation", "growth" and "labor_market" columns
+                for the input columns present, indexed like df
+        """
+        interpretation = {}
+        
+        for column, key, bins, labels in [
+            ("cpi", "inflation", self._inflation_bins, self._inflation_labels),
+            ("gdp", "growth", self._growth_bins, self._growth_labels),
+            ("unemployment", "labor_market", self._labor_market_bins, self._labor_market_labels)
+        ]:
+            if column in df:
+                # Left-closed bins match the side='right' threshold lookups
+                interpretation[key] = pd.cut(
+                    df[column],
+                    bins=np.concatenate(([-np.inf], bins, [np.inf])),
+                    labels=list(labels),
+                    right=False
+                )
+        
+        return pd.DataFrame(interpretation, index=df.index)
+    
+    def fetch_fed_minutes(self, use_mock_data=True, force_refresh=False):
         """
         Fetch and analyze recent Fed minutes
         
         Args:
             use_mock_data (bool): Whether to use mock data instead of actual scraping
+            force_refresh (bool): Whether to bypass the cached analysis
             
         Returns:
             dict: Analysis of Fed minutes
@@ -329,34 +922,79 @@ class MacroSentimentAnalyzer:
         # For demonstration purposes, we'll use mock data
         # In a real implementation, you would scrape and analyze actual Fed minutes
         if use_mock_data:
-            # Mock data for demonstration
-            fed_analysis = {
-                "latest_meeting": "2025-03-20",
-                "next_meeting": "2025-05-01",
-                "rate_decision": "hold",
-                "key_themes": [
-                    "inflation concerns",
-                    "labor market strength",
-                    "global economic uncertainty"
-                ],
-                "hawkish_dovish_score": 0.2,  # Positive is hawkish, negative is dovish
-                "rate_hike_probability": 0.3,
-                "rate_cut_probability": 0.1
-            }
+            fed_analysis = dict(_MOCK_FED_ANALYSIS, key_themes=list(_MOCK_FED_ANALYSIS["key_themes"]))
         else:
-            # Scrape and analyze actual Fed minutes
-            # This would require more complex implementation
-            # For now, we'll leave this as a placeholder
-            pass
+            fed_analysis = self._analyze_fed_minutes(force_refresh=force_refresh) or {}
         
         # Store the analysis
         self.indicators["fed_minutes"] = {
             "analysis": fed_analysis,
-            "timestamp": datetime.now()
+            "timestamp": self._timestamp()
         }
         
         return fed_analysis
     
+    @cached("fed_minutes", "fed_minutes")
+    def _analyze_fed_minutes(self):
+        """
+        Scrape and analyze the most recent Fed minutes
+        
+        Returns:
+            dict: Analysis of Fed minutes, or None if they could not be fetched
+        """
+        try:
+            calendar_url = self._fed_calendar_url
+            response = self._get(calendar_url)
+            
+            meeting_dates = _MINUTES_LINK_RE.findall(response.text)
+            if not meeting_dates:
+                print("Could not find Fed minutes on the calendar page")
+                return None
+            
+            latest_meeting = max(meeting_dates)
+            response = self._get(urljoin(calendar_url, f"fomcminutes{latest_meeting}.htm"))
+            
+            fed_analysis = self._score_fed_minutes(_HTML_TAG_RE.sub(" ", response.text))
+            fed_analysis["latest_meeting"] = f"{latest_meeting[:4]}-{latest_meeting[4:6]}-{latest_meeting[6:]}"
+            
+            return fed_analysis
+                
+        except Exception as e:
+            print(f"Error fetching Fed minutes: {str(e)}")
+            return None
+    
+    def _score_fed_minutes(self, text):
+        """
+        Score Fed minutes text on a hawkish/dovish scale
+        
+        Args:
+            text (str): Plain text of the minutes
+            
+        Returns:
+            dict: Hawkish/dovish score (mean keyword weight, positive is hawkish)
+                and the most mentioned keywords as key themes
+        """
+        text = " ".join(text.lower().split())
+        counts = Counter()
+        
+        if _FED_AUTOMATON is not None:
+            for end, keyword in _FED_AUTOMATON.iter(text):
+                start = end - len(keyword) + 1
+                
+                # Only count whole-word matches, like the regex fallback
+                if (start == 0 or not text[start - 1].isalnum()) and (end + 1 == len(text) or not text[end + 1].isalnum()):
+                    counts[keyword] += 1
+        else:
+            counts.update(_FED_KEYWORD_RE.findall(text))
+        
+        mentions = sum(counts.values())
+        score = sum(_FED_KEYWORDS[keyword] * count for keyword, count in counts.items()) / mentions if mentions else 0.0
+        
+        return {
+            "key_themes": [keyword for keyword, _ in counts.most_common(3)],
+            "hawkish_dovish_score": round(score, 2)
+        }
+    
     def rate_macro_environment(self):
         """
         Rate the macro environment based on all indicators
@@ -375,7 +1013,7 @@ class MacroSentimentAnalyzer:
             "inflation_environment": None,
             "growth_outlook": None,
             "overall_environment": None,
-            "timestamp": datetime.now()
+            "timestamp": self._timestamp()
         }
         
         # Determine risk sentiment
@@ -417,6 +1055,57 @@ class MacroSentimentAnalyzer:
         
         return rating
     
+    def rate_history(self, history):
+        """
+        Rate the macro environment for every date of a history
+        
+        Args:
+            history (MacroHistory): Raw indicator values per date
+            
+        Returns:
+            np.ndarray: Overall environment codes (int8), indexing ENVIRONMENT_LABELS
+        """
+        return self.rate_macro_environment_batch(
+            self._encode(self._vix_bins, history.vix),
+            self._encode(self._yield_curve_bins, history.yield_spread),
+            self._encode(self._inflation_bins, history.cpi_yoy),
+            self._encode(self._growth_bins, history.gdp_qoq)
+        )
+    
+    def _encode(self, bins, values):
+        """Map an array of values to the codes of their threshold bins, -1 where missing"""
+        values = np.asarray(values, dtype=np.float64)
+        return np.where(np.isnan(values), -1, np.searchsorted(bins, values, side='right')).astype(np.int8)
+    
+    def rate_macro_environment_batch(self, vix_codes, yield_curve_codes, inflation_codes, growth_codes):
+        """
+        Rate the macro environment for arrays of interpretation codes
+        
+        Codes are positions in the interpretation label tuples (e.g. VIX 0=low_volatility,
+        1=normal_volatility, 2=high_volatility; yield curve 0=inverted, 1=flat, 2=normal),
+        with -1 for a missing interpretation. Applies the same rules as
+        rate_macro_environment to every element at once.
+        
+        Args:
+            vix_codes (np.ndarray): VIX interpretation codes
+            yield_curve_codes (np.ndarray): Yield curve interpretation codes
+            inflation_codes (np.ndarray): Inflation interpretation codes
+            growth_codes (np.ndarray): Growth interpretation codes
+            
+        Returns:
+            np.ndarray: Overall environment codes (int8), indexing ENVIRONMENT_LABELS
+        """
+        vix_codes = np.asarray(vix_codes)
+        yield_curve_codes = np.asarray(yield_curve_codes)
+        
+        risk_on = (vix_codes == 0) & (yield_curve_codes != 0)
+        risk_off = (vix_codes == 2) | (yield_curve_codes == 0)
+        
+        bullish = risk_on & (np.asarray(inflation_codes) != 2)
+        bearish = risk_off | (np.asarray(growth_codes) == 0)
+        
+        return np.select([bullish, bearish], [0, 1], default=2).astype(np.int8)
+    
     def suggest_es_bias(self):
         """
         Suggest long/short bias for S&P 500 E-mini futures (ES)
@@ -434,7 +1123,7 @@ class MacroSentimentAnalyzer:
             "direction": None,
             "confidence": None,
             "rationale": [],
-            "timestamp": datetime.now()
+            "timestamp": self._timestamp()
         }
         
         # Determine direction based on overall environment
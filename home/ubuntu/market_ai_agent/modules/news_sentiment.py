@@ -12,18 +12,92 @@ This module is responsible for:
 import os
 import re
 import json
+import asyncio
+import heapq
+import hashlib
 import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import numpy as np
 import pandas as pd
+import httpx
 import newspaper
-from newspaper import Article
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import requests
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from transformers import pipeline
 
+from modules._json import load_file
+from modules._nlp import ONNX_AVAILABLE, load_onnx_pipeline, shared_vader
+from modules.cache import FileCache, MISS, cached
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Paragraphs of the article body on common news page layouts
+_ARTICLE_TEXT_SELECTOR = "article p, div.article-body p, [itemprop=articleBody] p"
+
+# Minimum length of extracted text to count as an article
+_MIN_ARTICLE_LENGTH = 100
+
+# Common crypto names and their symbols
+_CRYPTO_NAMES = {
+    "bitcoin": "BTC",
+    "ethereum": "ETH",
+    "solana": "SOL",
+    "ripple": "XRP",
+    "cardano": "ADA",
+    "dogecoin": "DOGE",
+    "avalanche": "AVAX"
+}
+
+# URLs and emoticons, which VADER scores slowly on long inputs
+_VADER_NOISE_RE = re.compile(r'https?://\S+|[:;=][\-o\*\']?[\)\(\]\[dDpP/\\]')
+
+# Columns of the analyzed articles table
+_ANALYZED_COLUMNS = [
+    'source', 'url', 'title', 'publish_date', 'scraped_date', 'sentiment', 'compound',
+    'tickers', 'sectors', 'crypto', 'macro_themes', 'watchlist_match'
+]
+
+# English stop words (the NLTK list)
+_STOPWORDS = frozenset({
+    "i", "me", "my", "myself", "we", "our", "ours", "ourselves", "you", "you're", "you've",
+    "you'll", "you'd", "your", "yours", "yourself", "yourselves", "he", "him", "his", "himself",
+    "she", "she's", "her", "hers", "herself", "it", "it's", "its", "itself", "they", "them",
+    "their", "theirs", "themselves", "what", "which", "who", "whom", "this", "that", "that'll",
+    "these", "those", "am", "is", "are", "was", "were", "be", "been", "being", "have", "has",
+    "had", "having", "do", "does", "did", "doing", "a", "an", "the", "and", "but", "if", "or",
+    "because", "as", "until", "while", "of", "at", "by", "for", "with", "about", "against",
+    "between", "into", "through", "during", "before", "after", "above", "below", "to", "from",
+    "up", "down", "in", "out", "on", "off", "over", "under", "again", "further", "then", "once",
+    "here", "there", "when", "where", "why", "how", "all", "any", "both", "each", "few", "more",
+    "most", "other", "some", "such", "no", "nor", "not", "only", "own", "same", "so", "than",
+    "too", "very", "s", "t", "can", "will", "just", "don", "don't", "should", "should've",
+    "now", "d", "ll", "m", "o", "re", "ve", "y", "ain", "aren", "aren't", "couldn", "couldn't",
+    "didn", "didn't", "doesn", "doesn't", "hadn", "hadn't", "hasn", "hasn't", "haven", "haven't",
+    "isn", "isn't", "ma", "mightn", "mightn't", "mustn", "mustn't", "needn", "needn't", "shan",
+    "shan't", "shouldn", "shouldn't", "wasn", "wasn't", "weren", "weren't", "won", "won't",
+    "wouldn", "wouldn't"
+})
+
+def _canonical_url(url):
+    """Normalize an article URL so links to the same story from different pages compare equal"""
+    parts = urlsplit(url)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
 class NewsScraperSentiment:
     def __init__(self, config_path=None):
         """
@@ -49,30 +123,63 @@ class NewsScraperSentiment:
                 "inflation", "rate hike", "rate cut", "recession", "gdp", "unemployment",
                 "fed", "federal reserve", "interest rate", "monetary policy", "fiscal policy",
                 "supply chain", "earnings", "forecast", "guidance", "outlook"
-            ]
+            ],
+            "scraping": {
+                "max_concurrency": 10,  # Article downloads in flight at once
+                "timeout": 20,          # Seconds per article download
+                "articles_dir": os.path.join(".cache", "articles")  # Parquet copies of scraped articles
+            },
+            "nlp": {
+                "model": "ProsusAI/finbert",
+                "onnx_dir": os.path.join(".cache", "finbert-onnx-int8"),  # Quantized model export
+                "num_threads": os.cpu_count() or 1,  # ONNX Runtime intra-op threads
+                "batch_size": 32,       # Articles per transformer forward pass
+                "max_chars": 2000,      # Characters of text passed to the tokenizer
+                "head_cache_size": 4096,  # Transformer results kept in memory by leading text
+                "vader_max_chars": 4000,  # Characters of text scored by VADER
+                "vader_skip_threshold": 0.6  # |VADER compound| above which the transformer is skipped
+            },
+            "cache_dir": os.path.join(".cache", "sentiment"),
+            "cache_ttls": {
+                "sentiment": 604800,    # Sentiment scores of unchanged article text (1 week)
+                "source_index": 300     # Article URLs listed on each source's front page: 5 minutes
+            }
         }
         
         # Load custom configuration if provided
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = json.load(f)
-                self.config.update(custom_config)
+            custom_config = load_file(config_path)
+            self.config.update(custom_config)
         
-        # Initialize sentiment analyzer
-        self.vader = SentimentIntensityAnalyzer()
+        # Initialize sentiment analyzer (the lexicon is loaded once per process and shared)
+        self.vader = shared_vader()
         
         # Initialize transformers pipeline for more advanced NLP tasks
-        self.nlp = pipeline("text-classification", model="distilbert-base-uncased-finetuned-sst-2-english")
+        self.nlp = self._load_sentiment_pipeline()
         
         # Compile regex patterns for ticker symbols
         self.ticker_pattern = re.compile(r'\$([A-Z]{1,5})')
         
+        # Build one matcher over all watchlist sectors, crypto and macro themes
+        self._build_term_matcher()
+        
+        # Watchlist symbols as sets for constant-time membership tests
+        self._stocks_set = frozenset(self.config['watchlist']['stocks'])
+        self._crypto_set = frozenset(self.config['watchlist']['crypto'])
+        
         # Load stop words
-        self.stop_words = set(stopwords.words('english'))
+        self.stop_words = _STOPWORDS
+        
+        # Sentiment scores keyed by article text, shared across runs
+        self._cache = FileCache(self.config["cache_dir"])
+        
+        # Transformer results keyed by a hash of the truncated text the model sees
+        self._head_cache = OrderedDict()
         
         # Initialize data storage
         self.articles = []
         self.analyzed_data = []
+        self.analyzed_df = pd.DataFrame(columns=_ANALYZED_COLUMNS + ['abs_compound'])
     
     def scrape_news(self, max_articles_per_source=10):
         """
@@ -84,209 +191,672 @@ class NewsScraperSentiment:
         Returns:
             list: List of article dictionaries
         """
-        all_articles = []
+        return asyncio.run(self.scrape_news_async(max_articles_per_source))
+    
+    async def scrape_news_async(self, max_articles_per_source=10):
+        """
+        Scrape news from all configured sources concurrently
         
-        for source_name, url in self.config["sources"].items():
-            try:
-                print(f"Scraping {source_name} from {url}")
-                
-                # Build newspaper source
-                source = newspaper.build(url, memoize_articles=False)
-                
-                # Get articles
-                count = 0
-                for article in source.articles:
-                    if count >= max_articles_per_source:
-                        break
+        All article downloads share one pooled HTTP client and are bounded by a
+        semaphore of scraping.max_concurrency requests. A story linked from several
+        sources is downloaded once, for whichever source queues it first.
+        
+        Args:
+            max_articles_per_source (int): Maximum number of articles to scrape per source
+            
+        Returns:
+            list: List of article dictionaries
+        """
+        scraping_config = self.config["scraping"]
+        semaphore = asyncio.Semaphore(scraping_config["max_concurrency"])
+        seen_urls = set()  # Canonical URLs already queued by any source
+        
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=scraping_config["timeout"],
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; MarketAIAgent/1.0)"}
+        ) as client:
+            results = await asyncio.gather(*[
+                self._scrape_source(client, semaphore, seen_urls, source_name, url, max_articles_per_source)
+                for source_name, url in self.config["sources"].items()
+            ])
+        
+        all_articles = [article for articles in results for article in articles]
+        
+        self.articles = all_articles
+        self._save_articles(all_articles)
+        return all_articles
+    
+    def _save_articles(self, articles):
+        """
+        Save scraped articles to a zstd-compressed Parquet file
+        
+        Args:
+            articles (list): Article dictionaries
+            
+        Returns:
+            str: Path of the saved file, or None if there was nothing to save or it failed
+        """
+        if not articles:
+            return None
+        
+        articles_dir = self.config["scraping"]["articles_dir"]
+        path = os.path.join(articles_dir, f"articles_{datetime.datetime.now():%Y%m%d_%H%M%S}.parquet")
+        
+        try:
+            os.makedirs(articles_dir, exist_ok=True)
+            
+            # Write to a temporary file first so readers never see a partial file
+            tmp_path = f"{path}.tmp"
+            pd.DataFrame(articles).to_parquet(tmp_path, compression="zstd", index=False)
+            os.replace(tmp_path, path)
+            return path
+        except (ImportError, OSError, TypeError, ValueError) as e:
+            # Parquet support (pyarrow) is optional; keep the articles in memory only if it's missing
+            print(f"Error saving scraped articles: {str(e)}")
+            return None
+    
+    def load_articles(self, path):
+        """
+        Load articles saved by an earlier scrape for analysis
+        
+        Args:
+            path (str): Path of a Parquet file written by scrape_news
+            
+        Returns:
+            list: List of article dictionaries
+        """
+        df = pd.read_parquet(path)
+        df = df.astype(object).where(df.notna(), None)
+        
+        articles = df.to_dict('records')
+        for article in articles:
+            article['authors'] = list(article['authors']) if article['authors'] is not None else []
+            for column in ('publish_date', 'scraped_date'):
+                if isinstance(article[column], pd.Timestamp):
+                    article[column] = article[column].to_pydatetime()
+        
+        self.articles = articles
+        return articles
+    
+    async def _scrape_source(self, client, semaphore, seen_urls, source_name, url, max_articles):
+        """
+        Scrape up to max_articles articles from one source
+        
+        Args:
+            client (httpx.AsyncClient): HTTP client
+            semaphore (asyncio.Semaphore): Limit on concurrent downloads
+            seen_urls (set): Canonical URLs already queued, shared across sources
+            source_name (str): Name of the source
+            url (str): Source URL
+            max_articles (int): Maximum number of articles to scrape
+            
+        Returns:
+            list: List of article dictionaries
+        """
+        articles = []
+        
+        try:
+            print(f"Scraping {source_name} from {url}")
+            
+            candidates = await self._source_article_urls(url) or []
+            
+            # Download just enough candidates to fill the quota, in order, until it is met
+            position = 0
+            while len(articles) < max_articles and position < len(candidates):
+                batch = []
+                while position < len(candidates) and len(batch) < max_articles - len(articles):
+                    article_url = candidates[position]
+                    position += 1
                     
-                    try:
-                        article.download()
-                        article.parse()
-                        
-                        # Skip articles without text
-                        if not article.text or len(article.text) < 100:
-                            continue
-                        
-                        # Create article dictionary
-                        article_dict = {
-                            'source': source_name,
-                            'url': article.url,
-                            'title': article.title,
-                            'text': article.text,
-                            'publish_date': article.publish_date,
-                            'authors': article.authors,
-                            'top_image': article.top_image,
-                            'scraped_date': datetime.datetime.now()
-                        }
-                        
-                        all_articles.append(article_dict)
-                        count += 1
-                        
-                    except Exception as e:
-                        print(f"Error processing article {article.url}: {str(e)}")
+                    # Skip stories another source (or this one) has already queued
+                    canonical = _canonical_url(article_url)
+                    if canonical in seen_urls:
                         continue
+                    seen_urls.add(canonical)
+                    batch.append(article_url)
                 
-            except Exception as e:
-                print(f"Error scraping {source_name}: {str(e)}")
-                continue
+                fetched = await asyncio.gather(*[self._fetch_article(client, semaphore, source_name, article_url) for article_url in batch])
+                articles.extend(article_dict for article_dict in fetched if article_dict is not None)
+            
+        except Exception as e:
+            print(f"Error scraping {source_name}: {str(e)}")
         
-        self.articles = all_articles
-        return all_articles
+        return articles
+    
+    @cached("source_index", "source_index")
+    async def _source_article_urls(self, url):
+        """
+        List the article URLs linked from a source's front page
+        
+        Args:
+            url (str): Source URL
+            
+        Returns:
+            list: Article URLs, or None if none were found
+        """
+        # Build newspaper source (blocking, so keep it off the event loop)
+        source = await asyncio.to_thread(newspaper.build, url, memoize_articles=False)
+        return [article.url for article in source.articles] or None
+    
+    async def _fetch_article(self, client, semaphore, source_name, url):
+        """
+        Download and parse one article
+        
+        Args:
+            client (httpx.AsyncClient): HTTP client
+            semaphore (asyncio.Semaphore): Limit on concurrent downloads
+            source_name (str): Name of the source
+            url (str): Article URL
+            
+        Returns:
+            dict: Article dictionary, or None if it failed or has too little text
+        """
+        try:
+            async with semaphore:
+                response = await client.get(url)
+            response.raise_for_status()
+            
+            article = self._extract_article(response.text)
+            
+            # Skip articles without text
+            if not article['text'] or len(article['text']) < _MIN_ARTICLE_LENGTH:
+                return None
+            
+            # Create article dictionary
+            return {
+                'source': source_name,
+                'url': url,
+                'title': article['title'],
+                'text': article['text'],
+                'publish_date': article['publish_date'],
+                'authors': article['authors'],
+                'top_image': article['top_image'],
+                'scraped_date': datetime.datetime.now()
+            }
+            
+        except Exception as e:
+            print(f"Error processing article {url}: {str(e)}")
+            return None
+    
+    def _extract_article(self, html):
+        """
+        Extract the title, text and metadata of an article page
+        
+        Args:
+            html (str): Article page HTML
+            
+        Returns:
+            dict: Title, text, publish date, authors and top image of the article
+        """
+        tree = LexborHTMLParser(html)
+        
+        title_node = tree.css_first("h1") or tree.css_first("title")
+        title = title_node.text(strip=True) if title_node else ""
+        
+        text = "\n".join(filter(None, (node.text(strip=True) for node in tree.css(_ARTICLE_TEXT_SELECTOR))))
+        
+        # Fall back to a full boilerplate-removal pass only when the layout heuristic finds too little
+        if len(text) < _MIN_ARTICLE_LENGTH and trafilatura is not None:
+            text = trafilatura.extract(html) or text
+        
+        publish_date = self._meta_content(tree, 'meta[property="article:published_time"]', 'meta[name="pubdate"]')
+        try:
+            publish_date = datetime.datetime.fromisoformat(publish_date) if publish_date else None
+        except ValueError:
+            publish_date = None
+        
+        author = self._meta_content(tree, 'meta[name="author"]', 'meta[property="article:author"]')
+        
+        return {
+            'title': title,
+            'text': text,
+            'publish_date': publish_date,
+            'authors': [author] if author else [],
+            'top_image': self._meta_content(tree, 'meta[property="og:image"]') or ""
+        }
+    
+    def _meta_content(self, tree, *selectors):
+        """Get the content attribute of the first matching meta tag"""
+        for selector in selectors:
+            node = tree.css_first(selector)
+            if node is not None and node.attributes.get("content"):
+                return node.attributes["content"]
+        return None
     
     def analyze_sentiment(self):
         """
         Analyze sentiment for all scraped articles
         
+        Sentiment scoring runs in a worker thread while this thread extracts
+        tickers and themes, so the Python extraction work overlaps with
+        transformer inference, which releases the GIL.
+        
         Returns:
             list: List of analyzed article dictionaries
         """
         analyzed_articles = []
         
-        for article in self.articles:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Get VADER and transformer-based sentiment, reusing scores of already seen texts
+            scores_future = executor.submit(self._score_articles, self.articles)
+            
+            # Extract tickers, sectors, crypto tokens and macro themes in one pass per article
+            article_terms = []
+            for article in self.articles:
+                try:
+                    article_terms.append(self._extract_all(article['text'], article['title']))
+                except Exception as e:
+                    print(f"Error analyzing article {article['url']}: {str(e)}")
+                    article_terms.append(None)
+            
+            article_scores = scores_future.result()
+        
+        for article, sentiment_scores, terms in zip(self.articles, article_scores, article_terms):
+            if sentiment_scores is None or terms is None:
+                continue
+            
             try:
-                # Get VADER sentiment
-                vader_sentiment = self.vader.polarity_scores(article['text'])
-                
-                # Get transformer-based sentiment
-                transformer_sentiment = self.nlp(article['text'][:512])[0]  # Limit text length for transformer
-                
-                # Extract tickers mentioned in the article
-                tickers_mentioned = self._extract_tickers(article['text'], article['title'])
-                
-                # Extract sectors mentioned
-                sectors_mentioned = self._extract_sectors(article['text'])
-                
-                # Extract crypto tokens mentioned
-                crypto_mentioned = self._extract_crypto(article['text'], article['title'])
-                
-                # Extract macro themes
-                macro_themes = self._extract_macro_themes(article['text'])
-                
-                # Determine overall sentiment
-                compound_score = vader_sentiment['compound']
-                if compound_score >= 0.05:
-                    sentiment = "bullish"
-                elif compound_score <= -0.05:
-                    sentiment = "bearish"
-                else:
-                    sentiment = "neutral"
-                
-                # Create analyzed article dictionary
-                analyzed_article = {
-                    'source': article['source'],
-                    'url': article['url'],
-                    'title': article['title'],
-                    'publish_date': article['publish_date'],
-                    'scraped_date': article['scraped_date'],
-                    'sentiment': sentiment,
-                    'sentiment_scores': {
-                        'vader': vader_sentiment,
-                        'transformer': {
-                            'label': transformer_sentiment['label'],
-                            'score': transformer_sentiment['score']
-                        }
-                    },
-                    'tickers': tickers_mentioned,
-                    'sectors': sectors_mentioned,
-                    'crypto': crypto_mentioned,
-                    'macro_themes': macro_themes,
-                    'watchlist_match': any(ticker in self.config['watchlist']['stocks'] for ticker in tickers_mentioned) or
-                                      any(token in self.config['watchlist']['crypto'] for token in crypto_mentioned)
-                }
-                
-                analyzed_articles.append(analyzed_article)
-                
+                analyzed_articles.append(self._analyze_one(article, sentiment_scores, terms))
             except Exception as e:
                 print(f"Error analyzing article {article['url']}: {str(e)}")
                 continue
         
         self.analyzed_data = analyzed_articles
+        self.analyzed_df = self._analyzed_frame(analyzed_articles)
         return analyzed_articles
     
-    def _extract_tickers(self, text, title):
-        """Extract stock ticker symbols from text"""
-        # Look for tickers with $ symbol
-        dollar_tickers = self.ticker_pattern.findall(text + " " + title)
-        
-        # Look for tickers in watchlist
-        watchlist_tickers = []
-        for ticker in self.config['watchlist']['stocks']:
-            # Match whole word only
-            pattern = r'\b' + re.escape(ticker) + r'\b'
-            if re.search(pattern, text + " " + title):
-                watchlist_tickers.append(ticker)
-        
-        # Combine and remove duplicates
-        all_tickers = list(set(dollar_tickers + watchlist_tickers))
-        
-        return all_tickers
+    def _analyze_one(self, article, sentiment_scores, terms):
+        """
+        Build the analyzed article dictionary for one article
+        
+        Args:
+            article (dict): Article dictionary
+            sentiment_scores (dict): VADER and transformer scores of the article
+            terms (tuple): (tickers, sectors, crypto, macro_themes) lists from _extract_all
+            
+        Returns:
+            dict: Analyzed article dictionary
+        """
+        tickers_mentioned, sectors_mentioned, crypto_mentioned, macro_themes = terms
+        
+        # Determine overall sentiment
+        compound_score = sentiment_scores['vader']['compound']
+        if compound_score >= 0.05:
+            sentiment = "bullish"
+        elif compound_score <= -0.05:
+            sentiment = "bearish"
+        else:
+            sentiment = "neutral"
+        
+        # Create analyzed article dictionary
+        return {
+            'source': article['source'],
+            'url': article['url'],
+            'title': article['title'],
+            'publish_date': article['publish_date'],
+            'scraped_date': article['scraped_date'],
+            'sentiment': sentiment,
+            'sentiment_scores': sentiment_scores,
+            'tickers': tickers_mentioned,
+            'sectors': sectors_mentioned,
+            'crypto': crypto_mentioned,
+            'macro_themes': macro_themes,
+            'watchlist_match': not (self._stocks_set.isdisjoint(tickers_mentioned) and
+                                    self._crypto_set.isdisjoint(crypto_mentioned))
+        }
+    
+    def _analyzed_frame(self, analyzed_articles):
+        """
+        Build a flat table of analyzed articles for sorting and grouping
+        
+        Args:
+            analyzed_articles (list): Analyzed article dictionaries
+            
+        Returns:
+            pd.DataFrame: One row per article, in the same order, with the VADER compound score as a column
+        """
+        rows = [
+            {**{column: article[column] for column in _ANALYZED_COLUMNS if column != 'compound'},
+             'compound': article['sentiment_scores']['vader']['compound']}
+            for article in analyzed_articles
+        ]
+        df = pd.DataFrame(rows, columns=_ANALYZED_COLUMNS)
+        df['compound'] = df['compound'].astype(float)
+        df['abs_compound'] = df['compound'].abs()
+        return df
     
-    def _extract_sectors(self, text):
-        """Extract sectors mentioned in text"""
-        mentioned_sectors = []
-        for sector in self.config['watchlist']['sectors']:
-            if sector.lower() in text.lower():
-                mentioned_sectors.append(sector)
-        return mentioned_sectors
+    def _score_articles(self, articles):
+        """
+        Get VADER and transformer sentiment scores for articles
+        
+        Scores are cached by a hash of the article text and the model name, so
+        texts seen in earlier scrapes skip both analyzers. VADER scores the
+        remaining distinct texts; where its compound score is beyond
+        nlp.vader_skip_threshold the transformer label is taken from VADER, and
+        the transformer runs once, batched, over the rest.
+        
+        Args:
+            articles (list): Article dictionaries
+            
+        Returns:
+            list: Sentiment scores dictionary for each article, or None where analysis failed
+        """
+        ttl = self.config['cache_ttls']['sentiment']
+        scores = [None] * len(articles)
+        misses = {}  # Text hash -> article indices, so repeated texts are scored once
+        
+        for i, article in enumerate(articles):
+            digest = hashlib.blake2b(article['text'].encode('utf-8')).hexdigest()
+            if digest in misses:
+                misses[digest].append(i)
+                continue
+            
+            cached_scores = self._cache.get("sentiment", self._score_cache_params(digest), ttl)
+            if cached_scores is MISS:
+                misses[digest] = [i]
+            else:
+                scores[i] = cached_scores
+        
+        if not misses:
+            return scores
+        
+        # Get VADER sentiment on the leading text without URLs and emoticons
+        vader_results = {}
+        for digest, indices in misses.items():
+            article = articles[indices[0]]
+            try:
+                vader_text = _VADER_NOISE_RE.sub('', article['text'][:self.config['nlp']['vader_max_chars']])
+                vader_results[digest] = self.vader.polarity_scores(vader_text)
+            except Exception as e:
+                print(f"Error analyzing article {article['url']}: {str(e)}")
+        
+        # Strongly polarized VADER scores settle the label; the transformer only sees the ambiguous texts
+        threshold = self.config['nlp']['vader_skip_threshold']
+        transformer_results = {}
+        ambiguous = []
+        for digest, vader_sentiment in vader_results.items():
+            compound = vader_sentiment['compound']
+            if abs(compound) > threshold:
+                transformer_results[digest] = {
+                    'label': 'positive' if compound > 0 else 'negative',
+                    'score': min(0.99, abs(compound))
+                }
+            else:
+                ambiguous.append(digest)
+        
+        # Get transformer-based sentiment for the ambiguous texts in batches
+        classified = self._classify_texts([articles[misses[digest][0]]['text'] for digest in ambiguous])
+        transformer_results.update(zip(ambiguous, classified))
+        
+        for digest, vader_sentiment in vader_results.items():
+            transformer_sentiment = transformer_results[digest]
+            if transformer_sentiment is None:
+                continue
+            
+            article_scores = {
+                'vader': vader_sentiment,
+                'transformer': {
+                    'label': transformer_sentiment['label'],
+                    'score': transformer_sentiment['score']
+                }
+            }
+            self._cache.set("sentiment", self._score_cache_params(digest), article_scores, ttl)
+            for i in misses[digest]:
+                scores[i] = article_scores
+        
+        return scores
+    
+    def _score_cache_params(self, digest):
+        """Get the cache parameters for the scores of a text hash under the current NLP settings"""
+        return {
+            'text': digest,
+            'model': self.config['nlp']['model'],
+            'vader_max_chars': self.config['nlp']['vader_max_chars'],
+            'vader_skip_threshold': self.config['nlp']['vader_skip_threshold']
+        }
+    
+    def _load_sentiment_pipeline(self):
+        """
+        Load the financial sentiment classification pipeline
+        
+        Uses the INT8-quantized ONNX export of the model on CPU when optimum and
+        ONNX Runtime are installed, exporting it on first use. Otherwise runs the
+        PyTorch model, in float16 on the GPU when one is available.
+        
+        Returns:
+            callable: Text classification pipeline
+        """
+        nlp_config = self.config['nlp']
+        use_gpu = torch is not None and torch.cuda.is_available()
+        
+        if ONNX_AVAILABLE and not use_gpu:
+            try:
+                return load_onnx_pipeline(nlp_config['model'], nlp_config['onnx_dir'], nlp_config['num_threads'])
+            except Exception as e:
+                print(f"Error loading ONNX sentiment model, using PyTorch: {str(e)}")
+        
+        if use_gpu:
+            return pipeline("text-classification", model=nlp_config['model'], device=0, torch_dtype=torch.float16)
+        return pipeline("text-classification", model=nlp_config['model'], device=-1)
+    
+    def _classify_texts(self, texts):
+        """
+        Run the transformer pipeline over many texts in batches
+        
+        The model only sees the first nlp.max_chars characters, so texts sharing
+        that lead (wire-service copy, syndicated stories) are classified once and
+        the result is kept in a bounded in-memory LRU cache across calls.
+        
+        Args:
+            texts (list): Article texts
+            
+        Returns:
+            list: Pipeline result for each text, or None where classification failed
+        """
+        if not texts:
+            return []
+        
+        max_chars = self.config['nlp']['max_chars']
+        heads = {}  # Head hash -> truncated text, in order of first appearance
+        keys = []
+        for text in texts:
+            head = text[:max_chars]  # Limit text length for tokenizer
+            key = hashlib.blake2b(head.encode('utf-8'), digest_size=16).digest()
+            heads.setdefault(key, head)
+            keys.append(key)
+        
+        results = {}
+        for key in heads:
+            if key in self._head_cache:
+                self._head_cache.move_to_end(key)
+                results[key] = self._head_cache[key]
+        
+        pending = [key for key in heads if key not in results]
+        for key, result in zip(pending, self._run_pipeline([heads[key] for key in pending])):
+            results[key] = result
+            if result is not None:
+                self._head_cache[key] = result
+        
+        while len(self._head_cache) > self.config['nlp']['head_cache_size']:
+            self._head_cache.popitem(last=False)
+        
+        return [results[key] for key in keys]
     
-    def _extract_crypto(self, text, title):
-        """Extract crypto tokens mentioned in text"""
-        mentioned_crypto = []
-        combined_text = (text + " " + title).lower()
+    def _run_pipeline(self, truncated):
+        """
+        Classify truncated texts with the transformer pipeline
+        
+        Args:
+            truncated (list): Texts already cut to nlp.max_chars
+            
+        Returns:
+            list: Pipeline result for each text, or None where classification failed
+        """
+        if not truncated:
+            return []
+        
+        try:
+            return self.nlp(truncated, batch_size=self.config['nlp']['batch_size'], truncation=True, max_length=512)
+        except Exception as e:
+            print(f"Error in batched sentiment analysis, retrying per article: {str(e)}")
+        
+        # Classify one at a time so a single bad article doesn't drop the rest
+        results = []
+        for text in truncated:
+            try:
+                results.append(self.nlp(text, truncation=True, max_length=512)[0])
+            except Exception as e:
+                print(f"Error analyzing article text: {str(e)}")
+                results.append(None)
+        return results
+    
+    def _build_term_matcher(self):
+        """Build the ticker pattern, term table and Aho-Corasick automaton used by _extract_all"""
+        # Watchlist tickers match case-sensitively and as whole words only, longest first
+        stocks = sorted(self.config['watchlist']['stocks'], key=len, reverse=True)
+        self._watchlist_re = re.compile(r'\b(' + '|'.join(map(re.escape, stocks)) + r')\b') if stocks else None
+        
+        terms = {}
         
-        # Check for crypto tokens in watchlist
+        def add(term, category, canonical):
+            key = term.lower()
+            if key:
+                terms.setdefault(key, []).append((category, canonical))
+        
+        for sector in self.config['watchlist']['sectors']:
+            add(sector, 'sector', sector)
         for token in self.config['watchlist']['crypto']:
-            if token.lower() in combined_text:
-                mentioned_crypto.append(token)
-        
-        # Check for common crypto names
-        crypto_names = {
-            "bitcoin": "BTC",
-            "ethereum": "ETH",
-            "solana": "SOL",
-            "ripple": "XRP",
-            "cardano": "ADA",
-            "dogecoin": "DOGE",
-            "avalanche": "AVAX"
-        }
+            add(token, 'crypto', token)
+        for name, symbol in _CRYPTO_NAMES.items():
+            add(name, 'crypto_name', name)
+        for theme in self.config['macro_themes']:
+            add(theme, 'macro', theme)
         
-        for name, symbol in crypto_names.items():
-            if name in combined_text and symbol not in mentioned_crypto:
-                mentioned_crypto.append(symbol)
+        self._terms = {key: tuple(entries) for key, entries in terms.items()}
         
-        return mentioned_crypto
+        self._term_automaton = None
+        if ahocorasick is not None and self._terms:
+            self._term_automaton = ahocorasick.Automaton()
+            for key, entries in self._terms.items():
+                self._term_automaton.add_word(key, (key, entries))
+            self._term_automaton.make_automaton()
     
-    def _extract_macro_themes(self, text):
-        """Extract macro themes mentioned in text"""
+    def _matched_terms(self, text_lower):
+        """Get the (category, canonical) entries of every distinct term found in lowercased text"""
+        if self._term_automaton is not None:
+            return {key: entries for _, (key, entries) in self._term_automaton.iter(text_lower)}.values()
+        
+        # Without pyahocorasick, test each term with C-level substring search; only presence matters
+        return [entries for key, entries in self._terms.items() if key in text_lower]
+    
+    def _extract_all(self, text, title):
+        """
+        Extract tickers, sectors, crypto tokens and macro themes from an article
+        
+        Sectors and macro themes are matched in the text only; tickers and crypto
+        tokens in the text and title. Watchlist tickers must match case and whole words.
+        The text and title are each lowercased once and scanned separately, so no
+        combined copy of the article is built.
+        
+        Args:
+            text (str): Article text
+            title (str): Article title
+            
+        Returns:
+            tuple: (tickers, sectors, crypto, macro_themes) lists
+        """
         text_lower = text.lower()
-        mentioned_themes = []
+        title_lower = title.lower()
         
-        for theme in self.config['macro_themes']:
-            if theme.lower() in text_lower:
-                mentioned_themes.append(theme)
+        found = {'sector': set(), 'crypto': set(), 'crypto_name': set(), 'macro': set()}
+        for lowered, in_text in ((text_lower, True), (title_lower, False)):
+            for entries in self._matched_terms(lowered):
+                for category, canonical in entries:
+                    if in_text or category not in ('sector', 'macro'):
+                        found[category].add(canonical)
+        
+        # Look for tickers with $ symbol and tickers in watchlist, without duplicates
+        tickers = set()
+        for part in (text, title):
+            tickers.update(self.ticker_pattern.findall(part))
+            if self._watchlist_re is not None:
+                tickers.update(self._watchlist_re.findall(part))
+        tickers = list(tickers)
         
-        return mentioned_themes
+        sectors = [sector for sector in self.config['watchlist']['sectors'] if sector in found['sector']]
+        
+        crypto = [token for token in self.config['watchlist']['crypto'] if token in found['crypto']]
+        for name, symbol in _CRYPTO_NAMES.items():
+            if name in found['crypto_name'] and symbol not in crypto:
+                crypto.append(symbol)
+        
+        macro_themes = [theme for theme in self.config['macro_themes'] if theme in found['macro']]
+        
+        return tickers, sectors, crypto, macro_themes
     
-    def prioritize_articles(self):
+    def prioritize_articles(self, top_k=None):
         """
         Prioritize articles based on watchlist matches and sentiment strength
         
+        Args:
+            top_k (int): Return only the first top_k articles, selected with a
+                bounded heap instead of a full sort
+            
         Returns:
             list: Prioritized list of analyzed articles
         """
         if not self.analyzed_data:
             return []
         
-        # Create a copy of the analyzed data
-        prioritized = self.analyzed_data.copy()
+        if top_k is not None:
+            # Same order as the full sort: watchlist matches first, then by absolute sentiment score
+            watchlist_match = self.analyzed_df['watchlist_match'].tolist()
+            abs_compound = self.analyzed_df['abs_compound'].tolist()
+            order = heapq.nsmallest(top_k, range(len(watchlist_match)),
+                                    key=lambda i: (not watchlist_match[i], -abs_compound[i]))
+            return [self.analyzed_data[i] for i in order]
         
         # Sort by watchlist match (True first) and then by absolute sentiment score
-        prioritized.sort(key=lambda x: (
-            not x['watchlist_match'],  # Watchlist matches first
-            -abs(x['sentiment_scores']['vader']['compound'])  # Then by sentiment strength
-        ))
+        order = self.analyzed_df.sort_values(['watchlist_match', 'abs_compound'], ascending=[False, False],
+                                             kind='stable').index
         
-        return prioritized
+        return [self.analyzed_data[i] for i in order]
+    
+    def _symbol_sentiment(self):
+        """
+        Count article sentiment per stock ticker and crypto token in one grouped pass
+        
+        Returns:
+            tuple: (counts, articles) where counts is a DataFrame indexed by (type, symbol) in
+                order of first mention, stocks first, with bullish, bearish, neutral and total
+                columns, and articles maps (type, symbol) to its top 3 articles by absolute score
+        """
+        frames = []
+        for column, symbol_type in (('tickers', 'stock'), ('crypto', 'crypto')):
+            exploded = self.analyzed_df[['title', 'url', 'source', 'sentiment', 'compound', 'abs_compound', column]]
+            exploded = exploded.explode(column).dropna(subset=[column]).rename(columns={column: 'symbol'})
+            frames.append(exploded.assign(type=symbol_type))
+        combined = pd.concat(frames)
+        
+        if combined.empty:
+            return pd.DataFrame(columns=['bullish', 'bearish', 'neutral', 'total']), {}
+        
+        keys = ['type', 'symbol']
+        counts = combined.groupby(keys, sort=False)['sentiment'].value_counts().unstack(fill_value=0)
+        counts = counts.reindex(index=pd.MultiIndex.from_frame(combined[keys].drop_duplicates()),
+                                columns=['bullish', 'bearish', 'neutral'], fill_value=0)
+        counts['total'] = counts.sum(axis=1)
+        
+        top = combined.sort_values('abs_compound', ascending=False, kind='stable').groupby(keys, sort=False).head(3)
+        top = top.rename(columns={'compound': 'score'})
+        articles = {
+            key: group[['title', 'url', 'source', 'sentiment', 'score']].to_dict('records')
+            for key, group in top.groupby(keys, sort=False)
+        }
+        
+        return counts, articles
     
     def generate_position_suggestions(self):
         """
@@ -298,48 +868,15 @@ class NewsScraperSentiment:
         if not self.analyzed_data:
             return {"bullish": [], "bearish": [], "neutral": []}
         
-        # Group articles by ticker and sentiment
-        ticker_sentiment = {}
-        crypto_sentiment = {}
-        
-        for article in self.analyzed_data:
-            # Process stock tickers
-            for ticker in article['tickers']:
-                if ticker not in ticker_sentiment:
-                    ticker_sentiment[ticker] = {
-                        'bullish': 0,
-                        'bearish': 0,
-                        'neutral': 0,
-                        'articles': []
-                    }
-                
-                ticker_sentiment[ticker][article['sentiment']] += 1
-                ticker_sentiment[ticker]['articles'].append({
-                    'title': article['title'],
-                    'url': article['url'],
-                    'source': article['source'],
-                    'sentiment': article['sentiment'],
-                    'score': article['sentiment_scores']['vader']['compound']
-                })
-            
-            # Process crypto tokens
-            for token in article['crypto']:
-                if token not in crypto_sentiment:
-                    crypto_sentiment[token] = {
-                        'bullish': 0,
-                        'bearish': 0,
-                        'neutral': 0,
-                        'articles': []
-                    }
-                
-                crypto_sentiment[token][article['sentiment']] += 1
-                crypto_sentiment[token]['articles'].append({
-                    'title': article['title'],
-                    'url': article['url'],
-                    'source': article['source'],
-                    'sentiment': article['sentiment'],
-                    'score': article['sentiment_scores']['vader']['compound']
-                })
+        # Group articles by symbol and sentiment
+        counts, articles = self._symbol_sentiment()
+        counts = counts[counts['total'] >= 2]  # Require at least 2 articles to make a suggestion
+        
+        # Determine overall sentiment
+        sentiments = np.select(
+            [counts['bullish'] > counts['bearish'] * 1.5,  # Significantly more bullish
+             counts['bearish'] > counts['bullish'] * 1.5],  # Significantly more bearish
+            ['bullish', 'bearish'], default='neutral')
         
         # Generate position suggestions
         suggestions = {
@@ -348,59 +885,23 @@ class NewsScraperSentiment:
             'neutral': []
         }
         
-        # Process stock suggestions
-        for ticker, data in ticker_sentiment.items():
-            total_articles = data['bullish'] + data['bearish'] + data['neutral']
-            if total_articles < 2:  # Require at least 2 articles to make a suggestion
-                continue
-            
-            # Determine overall sentiment
-            if data['bullish'] > data['bearish'] * 1.5:  # Significantly more bullish
-                sentiment = 'bullish'
-            elif data['bearish'] > data['bullish'] * 1.5:  # Significantly more bearish
-                sentiment = 'bearish'
-            else:
-                sentiment = 'neutral'
-            
-            # Create suggestion
-            suggestion = {
-                'symbol': ticker,
-                'type': 'stock',
-                'sentiment': sentiment,
-                'confidence': (data[sentiment] / total_articles) * 100,
-                'article_count': total_articles,
-                'supporting_articles': sorted(data['articles'], key=lambda x: abs(x['score']), reverse=True)[:3],
-                'rationale': f"Based on {total_articles} recent articles with {data[sentiment]} sentiment majority."
-            }
-            
-            suggestions[sentiment].append(suggestion)
-        
-        # Process crypto suggestions
-        for token, data in crypto_sentiment.items():
-            total_articles = data['bullish'] + data['bearish'] + data['neutral']
-            if total_articles < 2:  # Require at least 2 articles to make a suggestion
-                continue
-            
-            # Determine overall sentiment
-            if data['bullish'] > data['bearish'] * 1.5:  # Significantly more bullish
-                sentiment = 'bullish'
-            elif data['bearish'] > data['bullish'] * 1.5:  # Significantly more bearish
-                sentiment = 'bearish'
-            else:
-                sentiment = 'neutral'
+        for key, sentiment, row in zip(counts.index, sentiments, counts.itertuples(index=False)):
+            symbol_type, symbol = key
+            total_articles = int(row.total)
+            majority = int(getattr(row, sentiment))
             
             # Create suggestion
             suggestion = {
-                'symbol': token,
-                'type': 'crypto',
-                'sentiment': sentiment,
-                'confidence': (data[sentiment] / total_articles) * 100,
+                'symbol': symbol,
+                'type': symbol_type,
+                'sentiment': str(sentiment),
+                'confidence': (majority / total_articles) * 100,
                 'article_count': total_articles,
-                'supporting_articles': sorted(data['articles'], key=lambda x: abs(x['score']), reverse=True)[:3],
-                'rationale': f"Based on {total_articles} recent articles with {data[sentiment]} sentiment majority."
+                'supporting_articles': articles[key],
+                'rationale': f"Based on {total_articles} recent articles with {majority} sentiment majority."
             }
             
-            suggestions[sentiment].append(suggestion)
+            suggestions[str(sentiment)].append(suggestion)
         
         # Sort suggestions by confidence
         for sentiment in suggestions:
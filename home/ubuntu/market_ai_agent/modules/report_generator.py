@@ -10,15 +10,49 @@ This module is responsible for:
 import os
 import json
 import datetime
-import pandas as pd
-import matplotlib.pyplot as plt
-from jinja2 import Template
-import smtplib
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.image import MIMEImage
 from email.mime.application import MIMEApplication
 
+from modules._json import load_file
+from modules._lazy import LazyModule
+
+# pandas, matplotlib and smtplib load only when a report step first uses them, so
+# importing this module (e.g., to build sections in a test) stays cheap
+pd = LazyModule("pandas")
+plt = LazyModule("matplotlib.pyplot")
+smtplib = LazyModule("smtplib")
+
+# Section templates, compiled once per process on first use. HTML templates escape
+# interpolated values (titles, rationales, URLs scraped from news sites).
+_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")),
+    autoescape=select_autoescape(["html", "html.j2"]),
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True
+)
+
+# Number formats used in section tables
+_FMT_PCT = "{:.1f}%".format      # Confidence
+_FMT_2F = "{:.2f}".format        # VIX level
+_FMT_3F = "{:.3f}".format        # Yield spread
+_FMT_3F_PCT = "{:.3f}%".format   # Treasury yield
+
+_ENV.filters["pct"] = _FMT_PCT
+
+# Fields of a news suggestion shown in the ticker sections
+_TICKER_KEYS = ("symbol", "type", "confidence", "article_count", "rationale", "supporting_articles")
+
+# Markdown list item for one supporting article
+_MD_ARTICLE = "- [{title}]({url}) ({source}, {sentiment})\n"
+
 class SummaryReportGenerator:
     def __init__(self, config_path=None):
         """
@@ -57,17 +91,22 @@ class SummaryReportGenerator:
         
         # Load custom configuration if provided
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = json.load(f)
-                self.config.update(custom_config)
+            custom_config = load_file(config_path)
+            self.config.update(custom_config)
         
         # Initialize data storage
         self.news_data = None
         self.macro_data = None
         self.cme_data = None
         self.sentiment_data = None
+        self.news_frames = {}  # News suggestion side -> DataFrame for ranking
         self.report_content = None
     
+    @cached_property
+    def _max_tickers(self):
+        """Maximum number of tickers per section (the configuration is fixed after init)"""
+        return self.config["report"]["max_tickers_per_section"]
+    
     def load_module_data(self, news_data_path=None, macro_data_path=None, 
                         cme_data_path=None, sentiment_data_path=None):
         """
@@ -82,25 +121,30 @@ class SummaryReportGenerator:
         Returns:
             bool: Whether all data was loaded successfully
         """
-        # Load news sentiment data
-        if news_data_path and os.path.exists(news_data_path):
-            with open(news_data_path, 'r') as f:
-                self.news_data = json.load(f)
-        
-        # Load macro sentiment data
-        if macro_data_path and os.path.exists(macro_data_path):
-            with open(macro_data_path, 'r') as f:
-                self.macro_data = json.load(f)
-        
-        # Load CME volume data
-        if cme_data_path and os.path.exists(cme_data_path):
-            with open(cme_data_path, 'r') as f:
-                self.cme_data = json.load(f)
-        
-        # Load sentiment cross-check data
-        if sentiment_data_path and os.path.exists(sentiment_data_path):
-            with open(sentiment_data_path, 'r') as f:
-                self.sentiment_data = json.load(f)
+        paths = {
+            "news_data": news_data_path,              # News sentiment data
+            "macro_data": macro_data_path,            # Macro sentiment data
+            "cme_data": cme_data_path,                # CME volume data
+            "sentiment_data": sentiment_data_path     # Sentiment cross-check data
+        }
+        
+        # The files are independent, so read and parse them concurrently
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            futures = {name: executor.submit(load_file, path) for name, path in paths.items() if path}
+        
+        for name, future in futures.items():
+            try:
+                setattr(self, name, future.result())
+            except FileNotFoundError:
+                # Module hasn't produced output; open() tells us, so no separate stat is needed
+                continue
+        
+        # Tabulate the news suggestions once so sections can rank them in NumPy
+        self.news_frames = {
+            side: pd.DataFrame(self.news_data[side])
+            for side in ("bullish", "bearish")
+            if isinstance(self.news_data, dict) and self.news_data.get(side)
+        }
         
         # Check if we have at least some data
         return any([self.news_data, self.macro_data, self.cme_data, self.sentiment_data])
@@ -112,158 +156,77 @@ class SummaryReportGenerator:
         Returns:
             dict: Section data
         """
-        section = {
-            "title": "Top Bullish Tickers",
-            "tickers": [],
-            "html": "",
-            "markdown": ""
-        }
-        
-        # Check if we have news sentiment data
-        if not self.news_data or "bullish" not in self.news_data:
-            return section
-        
-        # Get top bullish tickers
-        max_tickers = self.config["report"]["max_tickers_per_section"]
-        top_tickers = self.news_data["bullish"][:max_tickers]
-        
-        # Format ticker data
-        for ticker in top_tickers:
-            ticker_data = {
-                "symbol": ticker["symbol"],
-                "type": ticker["type"],
-                "confidence": ticker["confidence"],
-                "article_count": ticker["article_count"],
-                "rationale": ticker["rationale"],
-                "supporting_articles": ticker["supporting_articles"]
-            }
-            section["tickers"].append(ticker_data)
-        
-        # Generate HTML
-        html = "<h2>Top Bullish Tickers</h2>\n"
-        if section["tickers"]:
-            html += "<table border='1' cellpadding='5' cellspacing='0'>\n"
-            html += "<tr><th>Symbol</th><th>Type</th><th>Confidence</th><th>Articles</th><th>Rationale</th></tr>\n"
-            
-            for ticker in section["tickers"]:
-                html += f"<tr><td><b>{ticker['symbol']}</b></td><td>{ticker['type']}</td>"
-                html += f"<td>{ticker['confidence']:.1f}%</td><td>{ticker['article_count']}</td>"
-                html += f"<td>{ticker['rationale']}</td></tr>\n"
-            
-            html += "</table>\n"
-            
-            # Add supporting articles
-            html += "<h3>Supporting Articles</h3>\n"
-            for ticker in section["tickers"]:
-                html += f"<h4>{ticker['symbol']}</h4>\n<ul>\n"
-                for article in ticker["supporting_articles"]:
-                    html += f"<li><a href='{article['url']}'>{article['title']}</a> ({article['source']}, {article['sentiment']})</li>\n"
-                html += "</ul>\n"
-        else:
-            html += "<p>No bullish tickers found in today's analysis.</p>\n"
-        
-        section["html"] = html
-        
-        # Generate Markdown
-        markdown = "## Top Bullish Tickers\n\n"
-        if section["tickers"]:
-            markdown += "| Symbol | Type | Confidence | Articles | Rationale |\n"
-            markdown += "|--------|------|------------|----------|----------|\n"
-            
-            for ticker in section["tickers"]:
-                markdown += f"| **{ticker['symbol']}** | {ticker['type']} | {ticker['confidence']:.1f}% | {ticker['article_count']} | {ticker['rationale']} |\n"
-            
-            markdown += "\n### Supporting Articles\n\n"
-            for ticker in section["tickers"]:
-                markdown += f"#### {ticker['symbol']}\n\n"
-                for article in ticker["supporting_articles"]:
-                    markdown += f"- [{article['title']}]({article['url']}) ({article['source']}, {article['sentiment']})\n"
-                markdown += "\n"
-        else:
-            markdown += "No bullish tickers found in today's analysis.\n\n"
-        
-        section["markdown"] = markdown
-        
-        return section
+        return self._generate_ticker_section("bullish", "Top Bullish Tickers")
     
     def generate_top_bearish_tickers_section(self):
         """
         Generate the top bearish tickers section
         
+        Returns:
+            dict: Section data
+        """
+        return self._generate_ticker_section("bearish", "Top Bearish Tickers")
+    
+    def _generate_ticker_section(self, side, title):
+        """
+        Generate a top tickers section from one side of the news suggestions
+        
+        Args:
+            side (str): Suggestion list in the news data ("bullish" or "bearish")
+            title (str): Section title
+            
         Returns:
             dict: Section data
         """
         section = {
-            "title": "Top Bearish Tickers",
+            "title": title,
             "tickers": [],
             "html": "",
             "markdown": ""
         }
         
         # Check if we have news sentiment data
-        if not self.news_data or "bearish" not in self.news_data:
+        if not self.news_data or side not in self.news_data:
             return section
         
-        # Get top bearish tickers
-        max_tickers = self.config["report"]["max_tickers_per_section"]
-        top_tickers = self.news_data["bearish"][:max_tickers]
-        
-        # Format ticker data
-        for ticker in top_tickers:
-            ticker_data = {
-                "symbol": ticker["symbol"],
-                "type": ticker["type"],
-                "confidence": ticker["confidence"],
-                "article_count": ticker["article_count"],
-                "rationale": ticker["rationale"],
-                "supporting_articles": ticker["supporting_articles"]
-            }
-            section["tickers"].append(ticker_data)
+        # Get top tickers by confidence
+        suggestions = self.news_frames.get(side)
+        if suggestions is None:
+            suggestions = pd.DataFrame(self.news_data[side])
         
-        # Generate HTML
-        html = "<h2>Top Bearish Tickers</h2>\n"
-        if section["tickers"]:
-            html += "<table border='1' cellpadding='5' cellspacing='0'>\n"
-            html += "<tr><th>Symbol</th><th>Type</th><th>Confidence</th><th>Articles</th><th>Rationale</th></tr>\n"
-            
-            for ticker in section["tickers"]:
-                html += f"<tr><td><b>{ticker['symbol']}</b></td><td>{ticker['type']}</td>"
-                html += f"<td>{ticker['confidence']:.1f}%</td><td>{ticker['article_count']}</td>"
-                html += f"<td>{ticker['rationale']}</td></tr>\n"
-            
-            html += "</table>\n"
-            
-            # Add supporting articles
-            html += "<h3>Supporting Articles</h3>\n"
-            for ticker in section["tickers"]:
-                html += f"<h4>{ticker['symbol']}</h4>\n<ul>\n"
-                for article in ticker["supporting_articles"]:
-                    html += f"<li><a href='{article['url']}'>{article['title']}</a> ({article['source']}, {article['sentiment']})</li>\n"
-                html += "</ul>\n"
-        else:
-            html += "<p>No bearish tickers found in today's analysis.</p>\n"
+        # Keep just the report fields; to_dict builds fresh dicts, so no further copy is needed
+        tickers = []
+        if len(suggestions):
+            tickers = suggestions.nlargest(self._max_tickers, "confidence")[list(_TICKER_KEYS)].to_dict("records")
+        section["tickers"] = tickers
+        
+        empty_message = f"No {side} tickers found in today's analysis."
         
-        section["html"] = html
+        # Generate HTML
+        section["html"] = _ENV.get_template("ticker_section.html.j2").render(
+            title=title,
+            tickers=tickers,
+            empty_message=empty_message
+        )
         
         # Generate Markdown
-        markdown = "## Top Bearish Tickers\n\n"
-        if section["tickers"]:
-            markdown += "| Symbol | Type | Confidence | Articles | Rationale |\n"
-            markdown += "|--------|------|------------|----------|----------|\n"
+        markdown_parts = [f"## {title}\n\n"]
+        if tickers:
+            markdown_parts.append("| Symbol | Type | Confidence | Articles | Rationale |\n")
+            markdown_parts.append("|--------|------|------------|----------|----------|\n")
             
-            for ticker in section["tickers"]:
-                markdown += f"| **{ticker['symbol']}** | {ticker['type']} | {ticker['confidence']:.1f}% | {ticker['article_count']} | {ticker['rationale']} |\n"
+            # Build the table rows and supporting-article blocks in one pass over the tickers
+            article_parts = ["\n### Supporting Articles\n\n"]
+            for ticker in tickers:
+                markdown_parts.append(f"| **{ticker['symbol']}** | {ticker['type']} | {_FMT_PCT(ticker['confidence'])} | {ticker['article_count']} | {ticker['rationale']} |\n")
+                articles = "".join(map(_MD_ARTICLE.format_map, ticker["supporting_articles"]))
+                article_parts.append(f"#### {ticker['symbol']}\n\n{articles}\n")
             
-            markdown += "\n### Supporting Articles\n\n"
-            for ticker in section["tickers"]:
-                markdown += f"#### {ticker['symbol']}\n\n"
-                for article in ticker["supporting_articles"]:
-                    markdown += f"- [{article['title']}]({article['url']}) ({article['source']}, {article['sentiment']})\n"
-                markdown += "\n"
+            markdown_parts.extend(article_parts)
         else:
-            markdown += "No bearish tickers found in today's analysis.\n\n"
+            markdown_parts.append(f"{empty_message}\n\n")
         
-        section["markdown"] = markdown
+        section["markdown"] = "".join(markdown_parts)
         
         return section
     
@@ -291,27 +254,28 @@ class SummaryReportGenerator:
         indicators = self.macro_data.get("indicators", {})
         
         # Format section data
+        key_indicators = {}
         section["data"] = {
             "environment": environment,
             "es_bias": es_bias,
-            "indicators": {}
+            "indicators": key_indicators
         }
         
         # Extract key indicators
         if "vix" in indicators:
-            section["data"]["indicators"]["vix"] = {
+            key_indicators["vix"] = {
                 "value": indicators["vix"]["value"],
                 "interpretation": indicators["vix"]["interpretation"]
             }
         
         if "treasury_yields" in indicators and "values" in indicators["treasury_yields"]:
             yields = indicators["treasury_yields"]["values"]
-            section["data"]["indicators"]["yields"] = yields
-            section["data"]["indicators"]["yield_curve"] = indicators["treasury_yields"]["interpretation"]
+            key_indicators["yields"] = yields
+            key_indicators["yield_curve"] = indicators["treasury_yields"]["interpretation"]
         
         if "economic_data" in indicators and "values" in indicators["economic_data"]:
             econ_data = indicators["economic_data"]["values"]
-            section["data"]["indicators"]["economic_data"] = econ_data
+            key_indicators["economic_data"] = econ_data
         
         # Generate HTML
         html = "<h2>Macro Outlook (ES Directional Bias)</h2>\n"
@@ -368,20 +332,20 @@ class SummaryReportGenerator:
         html += "<tr><th>Indicator</th><th>Value</th><th>Interpretation</th></tr>\n"
         
         # VIX
-        if "vix" in section["data"]["indicators"]:
-            vix = section["data"]["indicators"]["vix"]
-            html += f"<tr><td>VIX</td><td>{vix['value']:.2f}</td><td>{vix['interpretation']}</td></tr>\n"
+        if "vix" in key_indicators:
+            vix = key_indicators["vix"]
+            html += f"<tr><td>VIX</td><td>{_FMT_2F(vix['value'])}</td><td>{vix['interpretation']}</td></tr>\n"
         
         # Yield Curve
-        if "yields" in section["data"]["indicators"]:
-            yields = section["data"]["indicators"]["yields"]
+        if "yields" in key_indicators:
+            yields = key_indicators["yields"]
             if "10y_2y_spread" in yields:
                 spread = yields["10y_2y_spread"]
                 color = "red" if spread < 0 else "green"
-                html += f"<tr><td>10Y-2Y Spread</td><td style='color: {color};'>{spread:.3f}</td>"
-                html += f"<td>{section['data']['indicators'].get('yield_curve', 'N/A')}</td></tr>\n"
+                html += f"<tr><td>10Y-2Y Spread</td><td style='color: {color};'>{_FMT_3F(spread)}</td>"
+                html += f"<td>{key_indicators.get('yield_curve', 'N/A')}</td></tr>\n"
             
             if "2y" in yields:
-                html += f"<tr><td>2-Year Treasury</td><td>{yields['2y']:.3f}%</td><td>-</td></tr>\n"
+                html += f"<tr><td>2-Year Treasury</td><td>{_FMT_3F_PCT(yields['2y'])}</td><td>-</td></tr>\n"
            
 (Content truncated due to size limit. Use line ranges to read in chunks)
\ No newline at end of file
@@ -10,13 +10,162 @@ This module is responsible for:
 import os
 import re
 import json
+import asyncio
 import datetime
+import contextlib
+from functools import cached_property, lru_cache
+from importlib.util import find_spec
 import pandas as pd
 import numpy as np
 import requests
-from bs4 import BeautifulSoup
-from transformers import pipeline
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import httpx
+
+from modules._json import load_file, loads
+from modules._lazy import LazyModule
+from modules._nlp import ONNX_AVAILABLE, load_onnx_pipeline, shared_vader
+from modules._social_numba import assign_sentiment_codes
+
+# transformers (and the PyTorch it pulls in) and bs4 load only when a step first
+# uses them, so importing this module and generating mock data stay cheap
+transformers = LazyModule("transformers")
+bs4 = LazyModule("bs4")
+
+# Optional backends, imported on first use as well; None when not installed
+torch = LazyModule("torch") if find_spec("torch") else None
+
+# Reddit post columns and their types when tabulated
+_POST_DTYPES = {
+    'id': 'object',
+    'subreddit': 'object',
+    'title': 'object',
+    'score': 'int32',
+    'num_comments': 'int32',
+    'created_utc': 'float64',
+    'tickers': 'object',
+    'url': 'object'
+}
+
+# Mock Reddit post titles by sentiment code (bullish, bearish, neutral) and template
+_POST_TITLES = np.array([
+    [
+        "{ticker} is going to the moon! 🚀",
+        "Why {ticker} is undervalued right now",
+        "Just bought more {ticker}, here's why",
+        "{ticker} earnings will crush expectations",
+        "The bull case for {ticker} that no one is talking about"
+    ],
+    [
+        "{ticker} is overvalued, change my mind",
+        "Why I'm shorting {ticker}",
+        "{ticker} is about to crash, here's why",
+        "The bear case for {ticker} that everyone is ignoring",
+        "Just sold all my {ticker}, here's why"
+    ],
+    [
+        "Thoughts on {ticker}?",
+        "{ticker} analysis - what am I missing?",
+        "Is {ticker} a good long-term hold?",
+        "DD on {ticker} - mixed signals",
+        "Should I buy {ticker} at current levels?"
+    ]
+])
+
+# Mock tweet texts for search terms by sentiment code and template
+_TWEET_TEXTS = np.array([
+    [
+        "Feeling bullish on {term} today! Markets looking strong.",
+        "{term} setup looks great, expecting a breakout soon.",
+        "Just added more {term} to my portfolio. The uptrend is clear.",
+        "Technical indicators for {term} all pointing up. Let's go!",
+        "{term} fundamentals are solid. This is just the beginning of the rally."
+    ],
+    [
+        "Not liking what I'm seeing in {term}. Bearish signals everywhere.",
+        "{term} looking toppy here. Taking profits and moving to cash.",
+        "The {term} rally is running out of steam. Be careful out there.",
+        "Technical breakdown imminent in {term}. Protect your capital.",
+        "{term} fundamentals deteriorating. This won't end well."
+    ],
+    [
+        "Mixed signals on {term} today. Staying neutral for now.",
+        "Watching {term} closely but not taking a position yet.",
+        "{term} at a critical juncture. Could go either way.",
+        "Need more data before making a call on {term}.",
+        "Interesting price action in {term} but waiting for confirmation."
+    ]
+])
+
+def _inference_context(bf16_autocast):
+    """
+    Get the context for transformer forward passes
+    
+    Disables autograd tracking and, when bf16_autocast is set, runs CPU
+    matmuls in bfloat16. Does nothing without PyTorch.
+    
+    Args:
+        bf16_autocast (bool): Whether to autocast to bfloat16
+        
+    Returns:
+        contextlib.AbstractContextManager: Inference context
+    """
+    stack = contextlib.ExitStack()
+    if torch is not None:
+        stack.enter_context(torch.inference_mode())
+        if bf16_autocast:
+            stack.enter_context(torch.autocast(device_type="cpu", dtype=torch.bfloat16))
+    return stack
+
+@lru_cache(maxsize=None)
+def _shared_pipeline(model, onnx_dir, num_threads, compile_model, bf16_autocast):
+    """
+    Get the process-wide post classification pipeline for a model
+    
+    Uses the INT8-quantized ONNX export of the model when optimum and ONNX
+    Runtime are installed, exporting it on first use, and the PyTorch model
+    otherwise. The PyTorch model can be compiled with torch.compile, which is
+    warmed up here under the same inference context as real batches so the
+    first one doesn't pay for compilation.
+    
+    Args:
+        model (str): Hugging Face model name
+        onnx_dir (str): Directory of the quantized ONNX export
+        num_threads (int): ONNX Runtime intra-op threads
+        compile_model (bool): Whether to compile the PyTorch model
+        bf16_autocast (bool): Whether forward passes autocast to bfloat16
+        
+    Returns:
+        callable: Text classification pipeline
+    """
+    if ONNX_AVAILABLE:
+        try:
+            return load_onnx_pipeline(model, onnx_dir, num_threads)
+        except Exception as e:
+            print(f"Error loading ONNX sentiment model, using PyTorch: {str(e)}")
+    
+    # Load the Rust tokenizer explicitly; tokenization dominates pipeline time on short posts
+    tokenizer = transformers.AutoTokenizer.from_pretrained(model, use_fast=True)
+    if not tokenizer.is_fast:
+        print(f"Error loading fast tokenizer for {model}, using the Python tokenizer")
+    
+    nlp = transformers.pipeline(
+        "text-classification",
+        model=transformers.AutoModelForSequenceClassification.from_pretrained(model),
+        tokenizer=tokenizer,
+        framework="pt"
+    )
+    
+    if compile_model and torch is not None:
+        # Compilation happens on the first call; dynamic shapes avoid a recompile per padded length
+        eager_model = nlp.model
+        try:
+            nlp.model = torch.compile(eager_model, dynamic=True)
+            with _inference_context(bf16_autocast):
+                nlp(["warmup"] * 2, batch_size=2)
+        except Exception as e:
+            print(f"Error compiling sentiment model, using eager mode: {str(e)}")
+            nlp.model = eager_model
+    
+    return nlp
 
 class SentimentCrossChecker:
     def __init__(self, config_path=None):
@@ -50,32 +199,183 @@ class SentimentCrossChecker:
                 "sectors": ["XLF", "XLK", "XLE", "XLV", "XLI", "XLP", "XLY", "XLU", "XLB", "XLRE"],
                 "crypto": ["BTC", "ETH", "SOL", "XRP", "ADA", "DOGE", "AVAX"]
             },
+            "http": {
+                "max_connections": 32,  # Social API requests in flight at once
+                "timeout": 20           # Seconds per request
+            },
             "sentiment_thresholds": {
                 "divergence": 0.3,  # Minimum difference to flag as divergence
                 "consensus": 0.7    # Minimum score to consider strong consensus
-            }
+            },
+            "nlp": {
+                "model": "distilbert-base-uncased-finetuned-sst-2-english",
+                "onnx_dir": os.path.join(".cache", "distilbert-sst2-onnx-int8"),  # Quantized model export
+                "num_threads": os.cpu_count() or 1,  # ONNX Runtime intra-op threads
+                "bf16_autocast": False,  # Run PyTorch CPU inference in bfloat16 (only fast with AVX512-BF16/AMX)
+                "compile": True         # torch.compile the PyTorch model when it is loaded
+            },
+            "mock_seed": None  # Seed for mock social data; None draws fresh entropy each run
         }
         
         # Load custom configuration if provided
         if config_path and os.path.exists(config_path):
-            with open(config_path, 'r') as f:
-                custom_config = json.load(f)
-                self.config.update(custom_config)
+            custom_config = load_file(config_path)
+            self.config.update(custom_config)
         
-        # Initialize sentiment analyzer
-        self.vader = SentimentIntensityAnalyzer()
+        # Every watchlist ticker once; they match case-sensitively and as whole words only, longest first
+        self._watchlist_tickers = tuple(dict.fromkeys(
+            ticker for tickers in self.config["watchlist"].values() for ticker in tickers))
+        tickers = sorted(self._watchlist_tickers, key=len, reverse=True)
+        self._ticker_re = re.compile(r'\b(' + '|'.join(map(re.escape, tickers)) + r')\b') if tickers else None
         
-        # Initialize transformers pipeline for more advanced NLP tasks
-        self.nlp = pipeline("text-classification", model="distilbert-base-uncased-finetuned-sst-2-english")
+        # Random generator for mock social data
+        self._rng = np.random.default_rng(self.config["mock_seed"])
         
         # Initialize data storage
         self.social_data = {}
         self.sentiment_analysis = {}
         self.divergences = []
+        self.reddit_frames = {}  # Subreddit -> DataFrame of posts for vectorized aggregation
+        
+        # Mock posts are idempotent within an hour, so repeated fetches reuse them
+        self._subreddit_mock = lru_cache(maxsize=32)(self._generate_subreddit_mock)
         
         # Reference to professional news sentiment (to be provided)
         self.news_sentiment = None
     
+    @cached_property
+    def vader(self):
+        """VADER sentiment analyzer, loaded on first use"""
+        return shared_vader()
+    
+    @cached_property
+    def nlp(self):
+        """Transformers pipeline for more advanced NLP tasks, loaded on first use"""
+        nlp_config = self.config["nlp"]
+        return _shared_pipeline(nlp_config["model"], nlp_config["onnx_dir"], nlp_config["num_threads"],
+                                nlp_config["compile"], nlp_config["bf16_autocast"])
+    
+    async def _fetch_all(self, urls):
+        """
+        Fetch and decode many JSON endpoints concurrently over one pooled client
+        
+        Args:
+            urls (list): Endpoint URLs
+            
+        Returns:
+            list: Decoded response for each URL, or None where the request failed
+        """
+        http_config = self.config["http"]
+        
+        async def fetch(client, url):
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+                return loads(response.content)
+            except Exception as e:
+                print(f"Error fetching {url}: {str(e)}")
+                return None
+        
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=http_config["max_connections"]),
+            timeout=http_config["timeout"],
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0 (compatible; MarketAIAgent/1.0)"}
+        ) as client:
+            return await asyncio.gather(*[fetch(client, url) for url in urls])
+    
+    def _extract_tickers(self, text):
+        """
+        Find watchlist tickers mentioned in a post
+        
+        Args:
+            text (str): Post title or tweet text
+            
+        Returns:
+            list: Watchlist tickers found in the text
+        """
+        if self._ticker_re is None:
+            return []
+        
+        return list(dict.fromkeys(self._ticker_re.findall(text)))
+    
+    def _generate_subreddit_mock(self, subreddit, hour_bucket):
+        """
+        Generate mock posts for a subreddit
+        
+        Served through self._subreddit_mock, so each subreddit is generated once
+        per hour; the returned frame is shared and must not be modified.
+        
+        Args:
+            subreddit (str): Subreddit name
+            hour_bucket (int): Hours since the epoch, the cache key for the generated posts
+            
+        Returns:
+            pandas.DataFrame: Mock posts sorted by score
+        """
+        # Generate different sentiment profiles for different subreddits
+        if subreddit == "wallstreetbets":
+            # WSB tends to be more extreme and meme-focused
+            bullish_ratio = 0.6  # 60% bullish
+            bearish_ratio = 0.3  # 30% bearish
+            neutral_ratio = 0.1  # 10% neutral
+            
+            # Common WSB tickers
+            tickers = ["GME", "AMC", "TSLA", "AAPL", "NVDA", "AMD", "PLTR", "SPY", "QQQ"]
+            
+        elif subreddit == "investing":
+            # Investing tends to be more balanced and conservative
+            bullish_ratio = 0.4  # 40% bullish
+            bearish_ratio = 0.3  # 30% bearish
+            neutral_ratio = 0.3  # 30% neutral
+            
+            # Common investing tickers
+            tickers = ["VTI", "VOO", "VXUS", "BND", "AAPL", "MSFT", "GOOGL", "AMZN", "BRK.B"]
+            
+        else:
+            # Default sentiment distribution
+            bullish_ratio = 0.5  # 50% bullish
+            bearish_ratio = 0.3  # 30% bearish
+            neutral_ratio = 0.2  # 20% neutral
+            
+            # Mix of tickers
+            tickers = self.config["watchlist"]["stocks"] + self.config["watchlist"]["indices"]
+        
+        # Generate mock posts
+        num_posts = min(self.config["sources"]["reddit"]["limit"], 50)  # Cap at 50 for mock data
+        
+        # Draw every post's sentiment, title, tickers and stats in one pass
+        rand = self._rng.random(num_posts)
+        sentiment_codes = assign_sentiment_codes(rand, bullish_ratio, bearish_ratio)
+        chosen_titles = _POST_TITLES[sentiment_codes, self._rng.integers(0, _POST_TITLES.shape[1], num_posts)]
+        
+        # Random tickers per post without replacement: first columns of a random permutation per row
+        num_tickers = min(3, len(tickers))
+        ticker_idx = np.argsort(self._rng.random((num_posts, len(tickers))), axis=1)[:, :num_tickers]
+        post_tickers = np.asarray(tickers)[ticker_idx].tolist()
+        title_ticker = self._rng.integers(0, num_tickers, num_posts)
+        
+        scores = self._rng.exponential(scale=50, size=num_posts).astype(np.int64)  # Upvotes follow exponential distribution
+        comments = self._rng.exponential(scale=20, size=num_posts).astype(np.int64)
+        created = datetime.datetime.now().timestamp() - self._rng.integers(1, 24, num_posts) * 3600.0
+        
+        frame = pd.DataFrame({
+            'id': [f"mock_{subreddit}_{i}" for i in range(num_posts)],
+            'subreddit': subreddit,
+            'title': [
+                title.format(ticker=post_tickers[i][title_ticker[i]])
+                for i, title in enumerate(chosen_titles.tolist())
+            ],
+            'score': scores,
+            'num_comments': comments,
+            'created_utc': created,
+            'tickers': post_tickers,
+            'url': [f"https://reddit.com/r/{subreddit}/mock_{i}" for i in range(num_posts)]
+        }).astype(_POST_DTYPES)
+        
+        # Sort by score
+        return frame.sort_values('score', ascending=False, kind='stable', ignore_index=True)
+    
     def fetch_reddit_data(self, use_mock_data=True):
         """
         Fetch data from Reddit
@@ -87,114 +387,56 @@ class SentimentCrossChecker:
             dict: Dictionary of Reddit data by subreddit
         """
         reddit_data = {}
+        reddit_frames = {}
         
         if use_mock_data:
-            # Generate mock data for demonstration
+            # Generate mock data for demonstration, reusing this hour's posts if already generated
             subreddits = self.config["sources"]["reddit"]["subreddits"]
+            hour_bucket = int(datetime.datetime.now().timestamp() // 3600)
             
             for subreddit in subreddits:
-                posts = []
-                
-                # Generate different sentiment profiles for different subreddits
-                if subreddit == "wallstreetbets":
-                    # WSB tends to be more extreme and meme-focused
-                    bullish_ratio = 0.6  # 60% bullish
-                    bearish_ratio = 0.3  # 30% bearish
-                    neutral_ratio = 0.1  # 10% neutral
-                    
-                    # Common WSB tickers
-                    tickers = ["GME", "AMC", "TSLA", "AAPL", "NVDA", "AMD", "PLTR", "SPY", "QQQ"]
-                    
-                elif subreddit == "investing":
-                    # Investing tends to be more balanced and conservative
-                    bullish_ratio = 0.4  # 40% bullish
-                    bearish_ratio = 0.3  # 30% bearish
-                    neutral_ratio = 0.3  # 30% neutral
-                    
-                    # Common investing tickers
-                    tickers = ["VTI", "VOO", "VXUS", "BND", "AAPL", "MSFT", "GOOGL", "AMZN", "BRK.B"]
-                    
-                else:
-                    # Default sentiment distribution
-                    bullish_ratio = 0.5  # 50% bullish
-                    bearish_ratio = 0.3  # 30% bearish
-                    neutral_ratio = 0.2  # 20% neutral
-                    
-                    # Mix of tickers
-                    tickers = self.config["watchlist"]["stocks"] + self.config["watchlist"]["indices"]
-                
-                # Generate mock posts
-                num_posts = min(self.config["sources"]["reddit"]["limit"], 50)  # Cap at 50 for mock data
+                frame = self._subreddit_mock(subreddit, hour_bucket)
+                reddit_frames[subreddit] = frame
+                reddit_data[subreddit] = frame.to_dict('records')
+        
+        else:
+            # Pull every subreddit's top listing from the public JSON endpoints at once
+            reddit_config = self.config["sources"]["reddit"]
+            subreddits = reddit_config["subreddits"]
+            listings = asyncio.run(self._fetch_all([
+                f"https://www.reddit.com/r/{subreddit}/top.json?t={reddit_config['timeframe']}&limit={reddit_config['limit']}"
+                for subreddit in subreddits
+            ]))
+            
+            for subreddit, listing in zip(subreddits, listings):
+                if listing is None:
+                    continue
                 
-                for i in range(num_posts):
-                    # Determine sentiment category
-                    rand = np.random.random()
-                    if rand < bullish_ratio:
-                        sentiment = "bullish"
-                    elif rand < bullish_ratio + bearish_ratio:
-                        sentiment = "bearish"
-                    else:
-                        sentiment = "neutral"
-                    
-                    # Select random tickers
-                    post_tickers = np.random.choice(tickers, size=min(3, len(tickers)), replace=False).tolist()
-                    
-                    # Generate title based on sentiment
-                    if sentiment == "bullish":
-                        titles = [
-                            f"{ticker} is going to the moon! 🚀",
-                            f"Why {ticker} is undervalued right now",
-                            f"Just bought more {ticker}, here's why",
-                            f"{ticker} earnings will crush expectations",
-                            f"The bull case for {ticker} that no one is talking about"
-                        ]
-                    elif sentiment == "bearish":
-                        titles = [
-                            f"{ticker} is overvalued, change my mind",
-                            f"Why I'm shorting {ticker}",
-                            f"{ticker} is about to crash, here's why",
-                            f"The bear case for {ticker} that everyone is ignoring",
-                            f"Just sold all my {ticker}, here's why"
-                        ]
-                    else:
-                        titles = [
-                            f"Thoughts on {ticker}?",
-                            f"{ticker} analysis - what am I missing?",
-                            f"Is {ticker} a good long-term hold?",
-                            f"DD on {ticker} - mixed signals",
-                            f"Should I buy {ticker} at current levels?"
-                        ]
-                    
-                    title = np.random.choice(titles).replace("{ticker}", np.random.choice(post_tickers))
-                    
-                    # Generate post data
-                    post = {
-                        'id': f"mock_{subreddit}_{i}",
+                posts = []
+                for child in listing.get('data', {}).get('children', []):
+                    data = child.get('data', {})
+                    title = data.get('title', '')
+                    posts.append({
+                        'id': data.get('id'),
                         'subreddit': subreddit,
                         'title': title,
-                        'score': int(np.random.exponential(scale=50)),  # Upvotes follow exponential distribution
-                        'num_comments': int(np.random.exponential(scale=20)),
-                        'created_utc': (datetime.datetime.now() - datetime.timedelta(hours=np.random.randint(1, 24))).timestamp(),
-                        'tickers': post_tickers,
-                        'url': f"https://reddit.com/r/{subreddit}/mock_{i}"
-                    }
-                    
-                    posts.append(post)
-                
-                # Sort by score
-                posts.sort(key=lambda x: x['score'], reverse=True)
+                        'score': data.get('score', 0),
+                        'num_comments': data.get('num_comments', 0),
+                        'created_utc': data.get('created_utc'),
+                        'tickers': self._extract_tickers(title),
+                        'url': f"https://reddit.com{data.get('permalink', '')}"
+                    })
                 
+                reddit_frames[subreddit] = pd.DataFrame(posts, columns=list(_POST_DTYPES)).astype(_POST_DTYPES)
                 reddit_data[subreddit] = posts
-        
-        else:
-            # In a real implementation, you would use the Reddit API or PRAW
-            # This would require proper authentication and API handling
-            # For now, we'll leave this as a placeholder
-            print("Real Reddit API not implemented, using mock data instead")
-            return self.fetch_reddit_data(use_mock_data=True)
+            
+            if not reddit_data:
+                print("Reddit API unavailable, using mock data instead")
+                return self.fetch_reddit_data(use_mock_data=True)
         
         # Store the data
         self.social_data["reddit"] = reddit_data
+        self.reddit_frames = reddit_frames
         
         return reddit_data
     
@@ -220,8 +462,6 @@ class SentimentCrossChecker:
             
             # Generate mock tweets for search terms
             for term in search_terms:
-                tweets = []
-                
                 # Determine sentiment distribution based on term
                 if term in ["stocks", "investing", "market"]:
                     # General terms tend to be more balanced
@@ -241,62 +481,36 @@ class SentimentCrossChecker:
                 # Generate mock tweets
                 num_tweets = min(self.config["sources"]["twitter"]["limit"], 30)  # Cap at 30 for mock data
                 
-                for i in range(num_tweets):
-                    # Determine sentiment category
-                    rand = np.random.random()
-                    if rand < bullish_ratio:
-                        sentiment = "bullish"
-                    elif rand < bullish_ratio + bearish_ratio:
-                        sentiment = "bearish"
-                    else:
-                        sentiment = "neutral"
-                    
-                    # Generate tweet text based on sentiment
-                    if sentiment == "bullish":
-                        texts = [
-                            f"Feeling bullish on {term} today! Markets looking strong.",
-                            f"{term} setup looks great, expecting a breakout soon.",
-                            f"Just added more {term} to my portfolio. The uptrend is clear.",
-                            f"Technical indicators for {term} all pointing up. Let's go!",
-                            f"{term} fundamentals are solid. This is just the beginning of the rally."
-                        ]
-                    elif sentiment == "bearish":
-                        texts = [
-                            f"Not liking what I'm seeing in {term}. Bearish signals everywhere.",
-                            f"{term} looking toppy here. Taking profits and moving to cash.",
-                            f"The {term} rally is running out of steam. Be careful out there.",
-                            f"Technical breakdown imminent in {term}. Protect your capital.",
-                            f"{term} fundamentals deteriorating. This won't end well."
-                        ]
-                    else:
-                        texts = [
-                            f"Mixed signals on {term} today. Staying neutral for now.",
-                            f"Watching {term} closely but not taking a position yet.",
-                            f"{term} at a critical juncture. Could go either way.",
-                            f"Need more data before making a call on {term}.",
-                            f"Interesting price action in {term} but waiting for confirmation."
-                        ]
-                    
-                    text = np.random.choice(texts)
-                    
-                    # Generate tweet data
-                    tweet = {
+                # Draw every tweet's sentiment, text and stats in one pass
+                rand = self._rng.random(num_tweets)
+                sentiment_codes = assign_sentiment_codes(rand, bullish_ratio, bearish_ratio)
+                chosen_texts = _TWEET_TEXTS[sentiment_codes, self._rng.integers(0, _TWEET_TEXTS.shape[1], num_tweets)]
+                
+                likes = self._rng.exponential(scale=20, size=num_tweets).astype(np.int64)
+                retweets = self._rng.exponential(scale=5, size=num_tweets).astype(np.int64)
+                hours = self._rng.integers(1, 12, num_tweets)
+                user_ids = self._rng.integers(1000, 9999, num_tweets)
+                followers = self._rng.exponential(scale=500, size=num_tweets).astype(np.int64)
+                now = datetime.datetime.now()
+                
+                tweets = [
+                    {
                         'id': f"mock_{term}_{i}",
-                        'text': text,
-                        'likes': int(np.random.exponential(scale=20)),
-                        'retweets': int(np.random.exponential(scale=5)),
-                        'created_at': (datetime.datetime.now() - datetime.timedelta(hours=np.random.randint(1, 12))).isoformat(),
+                        'text': text.format(term=term),
+                        'likes': int(likes[i]),
+                        'retweets': int(retweets[i]),
+                        'created_at': (now - datetime.timedelta(hours=int(hours[i]))).isoformat(),
                         'user': {
-                            'username': f"mock_user_{np.random.randint(1000, 9999)}",
-                            'followers': int(np.random.exponential(scale=500))
+                            'username': f"mock_user_{user_ids[i]}",
+                            'followers': int(followers[i])
                         },
                         'search_term': term
                     }
-                    
-                    tweets.append(tweet)
+                    for i, text in enumerate(chosen_texts.tolist())
+                ]
                 
                 # Sort by engagement (likes + retweets)
-                tweets.sort(key=lambda x: x['likes'] + x['retweets'], reverse=True)
+                tweets = [tweets[i] for i in np.argsort(-(likes + retweets), kind='stable')]
                 
                 twitter_data["search_terms"][term] = tweets
             
@@ -325,7 +539,7 @@ class SentimentCrossChecker:
                 
                 for i in range(num_tweets):
                     # Determine sentiment category
-                    rand = np.random.random()
+                    rand = self._rng.random()
                     if rand < bullish_ratio:
                         sentiment = "bullish"
                     elif rand < bullish_ratio + bearish_ratio:
@@ -335,7 +549,7 @@ class SentimentCrossChecker:
                     
                     # Select random tickers
                     tickers = self.config["watchlist"]["stocks"]
-                    tweet_tickers = np.random.choice(tickers, size=min(2, len(tickers)), replace=False).tolist()
+                    tweet_tickers = self._rng.choice(tickers, size=min(2, len(tickers)), replace=False).tolist()
                     ticker = tweet_tickers[0]
                     
                     # Generate tweet text based on sentiment and influencer